@@ -2,72 +2,81 @@ import pandas as pd
 import streamlit as st
 
 from constant import ML_MODELS
-from utils import init_app, padding
-from sections import (
-    data_ingestion,
-    data_transformation,
-    train_model_section,
-    display_results,
+from utils import init_app, load_image, padding
+
+_HEADER_HTML = "<h4 style='color:#fff;font-weight:10px;padding-y:10px'>{}</h4>"
+SECTION_HEADERS = {
+    "ingestion": _HEADER_HTML.format("Data Ingestion"),
+    "transformation": _HEADER_HTML.format("Data Transformation"),
+    "train": _HEADER_HTML.format("Train Model"),
+}
+
+# served by streamlit's static file server, the browser caches it across reruns
+LOGO_HTML = (
+    "<div style='position:absolute;right:0;top:0;width:14%'>"
+    "<img src='app/static/images/logo.png' style='width:100%'></div>"
 )
 
 
+@st.fragment
+def results_section():
+    from sections import display_results
+
+    if st.session_state["created_models"] is not None:
+        with st.container(border=True):
+            display_results(st.session_state["created_models"])
+
+    if st.session_state["training_results"] is not None:
+        with st.container(border=True):
+            with st.columns(2)[0]:
+                st.dataframe(
+                    st.session_state["training_results"], use_container_width=True
+                )
+
+
 def main():
     init_app()
-    _1, _, logo = st.columns([1, 5, 1])
+    st.write(LOGO_HTML, unsafe_allow_html=True)
+    st.session_state["lightning_mode"] = st.toggle(
+        "Lightning Mode",
+        value=False,
+        help="Enables faster model training by ignoring hefty models and assigning budget time to each model.",
+    )
 
-    with _1:
-        st.session_state["lightning_mode"] = st.checkbox(
-            "Lightning Mode",
-            value=False,
-            help="Enables faster model training by ignoring hefty models and assigning budget time to each model.",
-        )
-    with logo:
-        st.image("static/images/logo.png")
+    # sections pulls in sklearn and pycaret, import it once the header is painted
+    from sections import data_ingestion, data_transformation, train_model_section
 
     ingestion, tranformation, train = st.columns(3)
     temp_container = st.empty()
 
     with ingestion:
         with st.container(border=True):
-            st.write(
-                "<h4 style='color:#fff;font-weight:10px;padding-y:10px'>Data Ingestion</h4>",
-                unsafe_allow_html=True,
-            )
+            st.write(SECTION_HEADERS["ingestion"], unsafe_allow_html=True)
             data_ingestion()
 
     with tranformation:
         with st.container(border=True):
-            st.write(
-                "<h4 style='color:#fff;font-weight:10px;padding-y:10px'>Data Transformation</h4>",
-                unsafe_allow_html=True,
-            )
+            st.write(SECTION_HEADERS["transformation"], unsafe_allow_html=True)
 
-            if not st.session_state["dataset"].empty:
+            if st.session_state["dataset_len"]:
                 data_transformation()
             else:
                 st.caption("Please upload a dataset to proceed.")
                 padding(5)
                 with st.columns([1, 1, 6.8])[-1]:
-                    st.image("static/images/2.png")
+                    st.image(load_image("static/images/2.png"))
     with train:
-        global created_models
         with st.container(border=True):
-            st.write(
-                "<h4 style='color:#fff;font-weight:10px;padding-y:10px'>Train Model</h4>",
-                unsafe_allow_html=True,
-            )
+            st.write(SECTION_HEADERS["train"], unsafe_allow_html=True)
 
             if (
-                not st.session_state["dataset"].empty
+                st.session_state["dataset_len"]
                 or st.session_state["training_results"]
             ):
                 try:
                     created_models = train_model_section()
                     if created_models is not None:
-                        with temp_container.container(border=True):
-                            # st.write(created_models)
-                            display_results(created_models)
-
+                        st.session_state["created_models"] = created_models
                         st.toast("Kindly scroll down to see the results.")
                         st.write(":green[Kindly scroll down to see the results.]")
 
@@ -77,17 +86,10 @@ def main():
                 st.caption("Please upload a dataset to proceed.")
                 padding(5)
                 with st.columns([1, 1, 6.8])[-1]:
-                    st.image("static/images/3.png")
+                    st.image(load_image("static/images/3.png"))
 
-    if st.session_state["training_results"] is not None:
-        display_results(created_models)
-
-    if st.session_state["training_results"] is not None:
-        with st.container(border=True):
-            with st.columns(2)[0]:
-                st.dataframe(
-                    st.session_state["training_results"], use_container_width=True
-                )
+    with temp_container.container():
+        results_section()
 
 
 if __name__ == "__main__":
@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Any, BinaryIO, Callable, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from joblib.memory import Memory
@@ -8,16 +8,17 @@ from joblib.memory import Memory
 from pycaret.anomaly.oop import AnomalyExperiment
 from pycaret.loggers.base_logger import BaseLogger
 from pycaret.utils.constants import DATAFRAME_LIKE, SEQUENCE_LIKE
-from pycaret.utils.generic import check_if_global_is_not_none
+from pycaret.utils.generic import check_if_current_experiment
 
 _EXPERIMENT_CLASS = AnomalyExperiment
 _CURRENT_EXPERIMENT: Optional[AnomalyExperiment] = None
 _CURRENT_EXPERIMENT_EXCEPTION = (
     "_CURRENT_EXPERIMENT global variable is not set. Please run setup() first."
 )
-_CURRENT_EXPERIMENT_DECORATOR_DICT = {
-    "_CURRENT_EXPERIMENT": _CURRENT_EXPERIMENT_EXCEPTION
-}
+
+
+def _current_experiment():
+    return _CURRENT_EXPERIMENT
 
 
 def setup(
@@ -32,7 +33,7 @@ def setup(
     ignore_features: Optional[List[str]] = None,
     keep_features: Optional[List[str]] = None,
     preprocess: bool = True,
-    create_date_columns: List[str] = ["day", "month", "year"],
+    create_date_columns: Tuple[str, ...] = ("day", "month", "year"),
     imputation_type: Optional[str] = "simple",
     numeric_imputation: str = "mean",
     categorical_imputation: str = "mode",
@@ -164,7 +165,7 @@ def setup(
         when preprocess is set to False.
 
 
-    create_date_columns: list of str, default = ["day", "month", "year"]
+    create_date_columns: list or tuple of str, default = ("day", "month", "year")
         Columns to create from the date features. Note that created features
         with zero variance (e.g. the feature hour in a column that only contains
         dates) are ignored. Allowed values are datetime attributes from
@@ -421,6 +422,8 @@ def setup(
             If False: No caching is performed.
             If True: A default temp directory is used.
             If str: Path to the caching directory.
+            If "auto": Like True, but only the expensive steps (iterative
+            imputation, text embedding, outlier removal, PCA, ...) are cached.
 
 
     profile: bool, default = False
@@ -498,7 +501,7 @@ def setup(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def create_model(
     model: Union[str, Any],
     fraction: float = 0.05,
@@ -578,7 +581,7 @@ def create_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def assign_model(
     model, transformation: bool = False, score: bool = True, verbose: bool = True
 ) -> pd.DataFrame:
@@ -622,7 +625,7 @@ def assign_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def plot_model(
     model,
     plot: str = "tsne",
@@ -695,7 +698,7 @@ def plot_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def evaluate_model(
     model,
     feature: Optional[str] = None,
@@ -744,7 +747,7 @@ def evaluate_model(
     )
 
 
-# not using check_if_global_is_not_none on purpose
+# not using check_if_current_experiment on purpose
 def predict_model(model, data: pd.DataFrame) -> pd.DataFrame:
     """
     This function generates anomaly labels on using a trained model.
@@ -790,7 +793,7 @@ def predict_model(model, data: pd.DataFrame) -> pd.DataFrame:
     return experiment.predict_model(estimator=model, data=data)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def deploy_model(
     model,
     model_name: str,
@@ -884,7 +887,7 @@ def deploy_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def save_model(
     model, model_name: str, model_only: bool = False, verbose: bool = True, **kwargs
 ):
@@ -938,7 +941,7 @@ def save_model(
     )
 
 
-# not using check_if_global_is_not_none on purpose
+# not using check_if_current_experiment on purpose
 def load_model(
     model_name: str,
     platform: Optional[str] = None,
@@ -998,7 +1001,7 @@ def load_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def pull(pop: bool = False) -> pd.DataFrame:
     """
     Returns the latest displayed table.
@@ -1017,7 +1020,7 @@ def pull(pop: bool = False) -> pd.DataFrame:
     return _CURRENT_EXPERIMENT.pull(pop=pop)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def models(
     internal: bool = False,
     raise_errors: bool = True,
@@ -1051,7 +1054,7 @@ def models(
     return _CURRENT_EXPERIMENT.models(internal=internal, raise_errors=raise_errors)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def get_logs(experiment_name: Optional[str] = None, save: bool = False) -> pd.DataFrame:
     """
     Returns a table of experiment logs. Only works when ``log_experiment``
@@ -1084,7 +1087,7 @@ def get_logs(experiment_name: Optional[str] = None, save: bool = False) -> pd.Da
     return _CURRENT_EXPERIMENT.get_logs(experiment_name=experiment_name, save=save)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def get_config(variable: Optional[str] = None):
     """
     This function is used to access global environment variables.
@@ -1110,7 +1113,7 @@ def get_config(variable: Optional[str] = None):
     return _CURRENT_EXPERIMENT.get_config(variable=variable)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def set_config(variable: str, value):
     """
     This function is used to reset global environment variables.
@@ -1125,7 +1128,7 @@ def set_config(variable: str, value):
     return _CURRENT_EXPERIMENT.set_config(variable=variable, value=value)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def save_experiment(
     path_or_file: Union[str, os.PathLike, BinaryIO], **cloudpickle_kwargs
 ) -> None:
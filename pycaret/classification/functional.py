@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Any, BinaryIO, Callable, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from joblib.memory import Memory
@@ -9,16 +9,17 @@ from pycaret.classification.oop import ClassificationExperiment
 from pycaret.internal.parallel.parallel_backend import ParallelBackend
 from pycaret.loggers.base_logger import BaseLogger
 from pycaret.utils.constants import DATAFRAME_LIKE, SEQUENCE_LIKE, TARGET_LIKE
-from pycaret.utils.generic import check_if_global_is_not_none
+from pycaret.utils.generic import check_if_current_experiment
 
 _EXPERIMENT_CLASS = ClassificationExperiment
 _CURRENT_EXPERIMENT: Optional[ClassificationExperiment] = None
 _CURRENT_EXPERIMENT_EXCEPTION = (
     "_CURRENT_EXPERIMENT global variable is not set. Please run setup() first."
 )
-_CURRENT_EXPERIMENT_DECORATOR_DICT = {
-    "_CURRENT_EXPERIMENT": _CURRENT_EXPERIMENT_EXCEPTION
-}
+
+
+def _current_experiment():
+    return _CURRENT_EXPERIMENT
 
 
 def setup(
@@ -36,7 +37,7 @@ def setup(
     ignore_features: Optional[List[str]] = None,
     keep_features: Optional[List[str]] = None,
     preprocess: bool = True,
-    create_date_columns: List[str] = ["day", "month", "year"],
+    create_date_columns: Tuple[str, ...] = ("day", "month", "year"),
     imputation_type: Optional[str] = "simple",
     numeric_imputation: Union[int, float, str] = "mean",
     categorical_imputation: str = "mode",
@@ -200,7 +201,7 @@ def setup(
         when preprocess is set to False.
 
 
-    create_date_columns: list of str, default = ["day", "month", "year"]
+    create_date_columns: list or tuple of str, default = ("day", "month", "year")
         Columns to create from the date features. Note that created features
         with zero variance (e.g. the feature hour in a column that only contains
         dates) are ignored. Allowed values are datetime attributes from
@@ -574,6 +575,8 @@ def setup(
             If False: No caching is performed.
             If True: A default temp directory is used.
             If str: Path to the caching directory.
+            If "auto": Like True, but only the expensive steps (iterative
+            imputation, text embedding, outlier removal, PCA, ...) are cached.
 
 
     profile: bool, default = False
@@ -669,7 +672,7 @@ def setup(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def compare_models(
     include: Optional[List[Union[str, Any]]] = None,
     exclude: Optional[List[str]] = None,
@@ -796,6 +799,8 @@ def compare_models(
         you can use ``FugueBackend(session)`` to make this function running using
         Spark. For more details, see
         :class:`~pycaret.parallel.fugue_backend.FugueBackend`
+        To use all local cores, pass ``JoblibBackend()`` from
+        :mod:`pycaret.internal.parallel`.
 
     Returns:
         Trained model or list of trained models, depending on the ``n_select`` param.
@@ -832,7 +837,7 @@ def compare_models(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def get_allowed_engines(estimator: str) -> Optional[str]:
     """Get all the allowed engines for the specified model
     Parameters
@@ -850,7 +855,7 @@ def get_allowed_engines(estimator: str) -> Optional[str]:
     return _CURRENT_EXPERIMENT.get_allowed_engines(estimator=estimator)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def get_engine(estimator: str) -> Optional[str]:
     """Gets the model engine currently set in the experiment for the specified
     model.
@@ -869,7 +874,7 @@ def get_engine(estimator: str) -> Optional[str]:
     return _CURRENT_EXPERIMENT.get_engine(estimator=estimator)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def create_model(
     estimator: Union[str, Any],
     fold: Optional[Union[int, Any]] = None,
@@ -1014,7 +1019,7 @@ def create_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def tune_model(
     estimator,
     fold: Optional[Union[int, Any]] = None,
@@ -1228,7 +1233,7 @@ def tune_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def ensemble_model(
     estimator,
     method: str = "Bagging",
@@ -1348,7 +1353,7 @@ def ensemble_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def blend_models(
     estimator_list: list,
     fold: Optional[Union[int, Any]] = None,
@@ -1468,7 +1473,7 @@ def blend_models(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def stack_models(
     estimator_list: list,
     meta_model=None,
@@ -1608,7 +1613,7 @@ def stack_models(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def plot_model(
     estimator,
     plot: str = "auc",
@@ -1736,7 +1741,7 @@ def plot_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def evaluate_model(
     estimator,
     fold: Optional[Union[int, Any]] = None,
@@ -1804,7 +1809,7 @@ def evaluate_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def interpret_model(
     estimator,
     plot: str = "summary",
@@ -1915,7 +1920,7 @@ def interpret_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def calibrate_model(
     estimator,
     method: str = "sigmoid",
@@ -2021,7 +2026,7 @@ def calibrate_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def optimize_threshold(
     estimator,
     optimize: str = "Accuracy",
@@ -2093,7 +2098,7 @@ def optimize_threshold(
     )
 
 
-# not using check_if_global_is_not_none on purpose
+# not using check_if_current_experiment on purpose
 def predict_model(
     estimator,
     data: Optional[pd.DataFrame] = None,
@@ -2180,7 +2185,7 @@ def predict_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def finalize_model(
     estimator,
     fit_kwargs: Optional[dict] = None,
@@ -2241,7 +2246,7 @@ def finalize_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def deploy_model(
     model,
     model_name: str,
@@ -2334,7 +2339,7 @@ def deploy_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def save_model(
     model, model_name: str, model_only: bool = False, verbose: bool = True, **kwargs
 ):
@@ -2387,7 +2392,7 @@ def save_model(
     )
 
 
-# not using check_if_global_is_not_none on purpose
+# not using check_if_current_experiment on purpose
 def load_model(
     model_name: str,
     platform: Optional[str] = None,
@@ -2447,7 +2452,7 @@ def load_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def automl(
     optimize: str = "Accuracy",
     use_holdout: bool = False,
@@ -2508,7 +2513,7 @@ def automl(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def pull(pop: bool = False) -> pd.DataFrame:
     """
     Returns the latest displayed table.
@@ -2527,7 +2532,7 @@ def pull(pop: bool = False) -> pd.DataFrame:
     return _CURRENT_EXPERIMENT.pull(pop=pop)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def models(
     type: Optional[str] = None,
     internal: bool = False,
@@ -2569,7 +2574,7 @@ def models(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def get_metrics(
     reset: bool = False,
     include_custom: bool = True,
@@ -2614,7 +2619,7 @@ def get_metrics(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def add_metric(
     id: str,
     name: str,
@@ -2686,7 +2691,7 @@ def add_metric(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def remove_metric(name_or_id: str):
     """
     Removes a metric from the experiment.
@@ -2712,7 +2717,7 @@ def remove_metric(name_or_id: str):
     return _CURRENT_EXPERIMENT.remove_metric(name_or_id=name_or_id)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def get_logs(experiment_name: Optional[str] = None, save: bool = False) -> pd.DataFrame:
     """
     Returns a table of experiment logs. Only works when ``log_experiment``
@@ -2745,7 +2750,7 @@ def get_logs(experiment_name: Optional[str] = None, save: bool = False) -> pd.Da
     return _CURRENT_EXPERIMENT.get_logs(experiment_name=experiment_name, save=save)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def get_config(variable: Optional[str] = None):
     """
     This function is used to access global environment variables.
@@ -2771,7 +2776,7 @@ def get_config(variable: Optional[str] = None):
     return _CURRENT_EXPERIMENT.get_config(variable=variable)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def set_config(variable: str, value):
     """
     This function is used to reset global environment variables.
@@ -2787,7 +2792,7 @@ def set_config(variable: str, value):
     return _CURRENT_EXPERIMENT.set_config(variable=variable, value=value)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def save_experiment(
     path_or_file: Union[str, os.PathLike, BinaryIO], **cloudpickle_kwargs
 ) -> None:
@@ -2889,7 +2894,7 @@ def load_experiment(
     return exp
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def get_leaderboard(
     finalize_models: bool = False,
     model_only: bool = False,
@@ -2947,7 +2952,7 @@ def get_leaderboard(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def dashboard(
     estimator,
     display_format: str = "dash",
@@ -3005,7 +3010,7 @@ def dashboard(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def convert_model(estimator, language: str = "python") -> str:
     """
     This function transpiles trained machine learning models into native
@@ -3057,7 +3062,7 @@ def convert_model(estimator, language: str = "python") -> str:
     return _CURRENT_EXPERIMENT.convert_model(estimator, language)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def check_fairness(estimator, sensitive_features: list, plot_kwargs: dict = {}):
     """
     There are many approaches to conceptualizing fairness. This function follows
@@ -3100,7 +3105,7 @@ def check_fairness(estimator, sensitive_features: list, plot_kwargs: dict = {}):
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def create_api(
     estimator, api_name: str, host: str = "127.0.0.1", port: int = 8000
 ) -> None:
@@ -3145,7 +3150,7 @@ def create_api(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def create_docker(
     api_name: str, base_image: str = "python:3.8-slim", expose_port: int = 8000
 ) -> None:
@@ -3185,7 +3190,7 @@ def create_docker(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def create_app(estimator, app_kwargs: Optional[dict] = None) -> None:
     """
     This function creates a basic gradio app for inference.
@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Any, BinaryIO, Callable, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from joblib.memory import Memory
@@ -8,16 +8,17 @@ from joblib.memory import Memory
 from pycaret.clustering.oop import ClusteringExperiment
 from pycaret.loggers.base_logger import BaseLogger
 from pycaret.utils.constants import DATAFRAME_LIKE, SEQUENCE_LIKE
-from pycaret.utils.generic import check_if_global_is_not_none
+from pycaret.utils.generic import check_if_current_experiment
 
 _EXPERIMENT_CLASS = ClusteringExperiment
 _CURRENT_EXPERIMENT: Optional[ClusteringExperiment] = None
 _CURRENT_EXPERIMENT_EXCEPTION = (
     "_CURRENT_EXPERIMENT global variable is not set. Please run setup() first."
 )
-_CURRENT_EXPERIMENT_DECORATOR_DICT = {
-    "_CURRENT_EXPERIMENT": _CURRENT_EXPERIMENT_EXCEPTION
-}
+
+
+def _current_experiment():
+    return _CURRENT_EXPERIMENT
 
 
 def setup(
@@ -32,7 +33,7 @@ def setup(
     ignore_features: Optional[List[str]] = None,
     keep_features: Optional[List[str]] = None,
     preprocess: bool = True,
-    create_date_columns: List[str] = ["day", "month", "year"],
+    create_date_columns: Tuple[str, ...] = ("day", "month", "year"),
     imputation_type: Optional[str] = "simple",
     numeric_imputation: str = "mean",
     categorical_imputation: str = "mode",
@@ -163,7 +164,7 @@ def setup(
         when preprocess is set to False.
 
 
-    create_date_columns: list of str, default = ["day", "month", "year"]
+    create_date_columns: list or tuple of str, default = ("day", "month", "year")
         Columns to create from the date features. Note that created features
         with zero variance (e.g. the feature hour in a column that only contains
         dates) are ignored. Allowed values are datetime attributes from
@@ -413,6 +414,8 @@ def setup(
             If False: No caching is performed.
             If True: A default temp directory is used.
             If str: Path to the caching directory.
+            If "auto": Like True, but only the expensive steps (iterative
+            imputation, text embedding, outlier removal, PCA, ...) are cached.
 
 
     profile: bool, default = False
@@ -488,7 +491,7 @@ def setup(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def get_allowed_engines(estimator: str) -> Optional[str]:
     """Get all the allowed engines for the specified model
     Parameters
@@ -506,7 +509,7 @@ def get_allowed_engines(estimator: str) -> Optional[str]:
     return _CURRENT_EXPERIMENT.get_allowed_engines(estimator=estimator)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def get_engine(estimator: str) -> Optional[str]:
     """Gets the model engine currently set in the experiment for the specified
     model.
@@ -525,7 +528,7 @@ def get_engine(estimator: str) -> Optional[str]:
     return _CURRENT_EXPERIMENT.get_engine(estimator=estimator)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def create_model(
     model: Union[str, Any],
     num_clusters: int = 4,
@@ -642,7 +645,7 @@ def create_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def assign_model(
     model, transformation: bool = False, verbose: bool = True
 ) -> pd.DataFrame:
@@ -683,7 +686,7 @@ def assign_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def plot_model(
     model,
     plot: str = "cluster",
@@ -763,7 +766,7 @@ def plot_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def evaluate_model(
     model,
     feature: Optional[str] = None,
@@ -814,7 +817,7 @@ def evaluate_model(
     )
 
 
-# not using check_if_global_is_not_none on purpose
+# not using check_if_current_experiment on purpose
 def predict_model(model, data: pd.DataFrame) -> pd.DataFrame:
     """
     This function generates cluster labels using a trained model.
@@ -864,7 +867,7 @@ def predict_model(model, data: pd.DataFrame) -> pd.DataFrame:
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def deploy_model(
     model,
     model_name: str,
@@ -957,7 +960,7 @@ def deploy_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def save_model(
     model, model_name: str, model_only: bool = False, verbose: bool = True, **kwargs
 ):
@@ -1011,7 +1014,7 @@ def save_model(
     )
 
 
-# not using check_if_global_is_not_none on purpose
+# not using check_if_current_experiment on purpose
 def load_model(
     model_name: str,
     platform: Optional[str] = None,
@@ -1071,7 +1074,7 @@ def load_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def pull(pop: bool = False) -> pd.DataFrame:
     """
     Returns the latest displayed table.
@@ -1090,7 +1093,7 @@ def pull(pop: bool = False) -> pd.DataFrame:
     return _CURRENT_EXPERIMENT.pull(pop=pop)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def models(internal: bool = False, raise_errors: bool = True) -> pd.DataFrame:
     """
     Returns table of models available in the model library.
@@ -1122,7 +1125,7 @@ def models(internal: bool = False, raise_errors: bool = True) -> pd.DataFrame:
     return _CURRENT_EXPERIMENT.models(internal=internal, raise_errors=raise_errors)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def get_metrics(
     reset: bool = False,
     include_custom: bool = True,
@@ -1166,7 +1169,7 @@ def get_metrics(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def add_metric(
     id: str,
     name: str,
@@ -1229,7 +1232,7 @@ def add_metric(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def remove_metric(name_or_id: str):
     """
     Removes a metric used for evaluation.
@@ -1256,7 +1259,7 @@ def remove_metric(name_or_id: str):
     return _CURRENT_EXPERIMENT.remove_metric(name_or_id=name_or_id)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def get_logs(experiment_name: Optional[str] = None, save: bool = False) -> pd.DataFrame:
     """
     Returns a table of experiment logs. Only works when ``log_experiment``
@@ -1289,7 +1292,7 @@ def get_logs(experiment_name: Optional[str] = None, save: bool = False) -> pd.Da
     return _CURRENT_EXPERIMENT.get_logs(experiment_name=experiment_name, save=save)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def get_config(variable: Optional[str] = None):
     """
     This function is used to access global environment variables.
@@ -1315,7 +1318,7 @@ def get_config(variable: Optional[str] = None):
     return _CURRENT_EXPERIMENT.get_config(variable=variable)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def set_config(variable: str, value):
     """
     This function is used to reset global environment variables.
@@ -1330,7 +1333,7 @@ def set_config(variable: str, value):
     return _CURRENT_EXPERIMENT.set_config(variable=variable, value=value)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def save_experiment(
     path_or_file: Union[str, os.PathLike, BinaryIO], **cloudpickle_kwargs
 ) -> None:
@@ -9,6 +9,7 @@
 # to complete the process. Refer to the existing classes for examples.
 
 import logging
+from importlib.util import find_spec
 from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
@@ -34,7 +35,7 @@ from pycaret.utils.generic import (
     param_grid_to_lists,
 )
 
-# First one in the list is the default ----
+# First one in the list is the default, unless sklearnex is installed ----
 ALL_ALLOWED_ENGINES: Dict[str, List[str]] = {
     "lr": ["sklearn", "sklearnex"],
     "knn": ["sklearn", "sklearnex"],
@@ -48,11 +49,17 @@ def get_container_default_engines() -> Dict[str, str]:
     -------
     Dict[str, str]
         Default engines for all containers. If unspecified, it is not included
-        in the return dictionary.
+        in the return dictionary. Models supporting sklearnex default to it
+        when scikit-learn-intelex is installed; pass e.g. engine={"lr": "sklearn"}
+        to opt out.
     """
+    use_sklearnex = find_spec("sklearnex") is not None
     default_engines = {}
     for id, all_engines in ALL_ALLOWED_ENGINES.items():
-        default_engines[id] = all_engines[0]
+        if use_sklearnex and "sklearnex" in all_engines:
+            default_engines[id] = "sklearnex"
+        else:
+            default_engines[id] = all_engines[0]
     return default_engines
 
 
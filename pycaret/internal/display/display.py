@@ -4,7 +4,11 @@
 
 from typing import Any, Dict, List, Optional
 
-from pycaret.internal.display.display_backend import SilentBackend, detect_backend
+from pycaret.internal.display.display_backend import (
+    SilentBackend,
+    detect_backend,
+    is_interactive,
+)
 from pycaret.internal.display.display_component import MonitorDisplay
 from pycaret.internal.display.progress_bar import ProgressBarDisplay
 from pycaret.internal.logging import get_logger
@@ -75,7 +79,8 @@ class CommonDisplay:
         monitor_rows: Optional[List[List[str]]] = None,
     ):
         self.logger = get_logger()
-        self.verbose = verbose
+        # Headless runs (CI, workers, servers) have nobody to show output to
+        self.verbose = verbose and is_interactive()
         self.html_param = html_param
 
         backend_id = "cli" if html_param is False else None
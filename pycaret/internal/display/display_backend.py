@@ -1,4 +1,6 @@
+import sys
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pprint import pprint
 from typing import Any, Dict, Optional, Union
 
@@ -53,6 +55,15 @@ def _is_in_jupyter_notebook() -> bool:
         return False
 
 
+@lru_cache(maxsize=None)
+def is_interactive() -> bool:
+    """Whether anyone can see the output: a notebook or a terminal."""
+    if IN_DATABRICKS or _is_in_jupyter_notebook():
+        return True
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty())
+
+
 class DisplayBackend(ABC):
     id: str
     can_update_text: bool
@@ -460,7 +460,12 @@ class FastMemory(Memory):
 
 def get_memory(memory: Union[bool, str, Path, Memory]) -> Memory:
     if memory is None or isinstance(memory, Memory):
+        # A caller's own Memory is used as given: its verbosity and limits are
+        # theirs, and pycaret never evicts from a directory it didn't create
         return memory
+    if memory == "auto":
+        # Same cache as memory=True, the steps to cache are picked by the experiment
+        memory = True
     if isinstance(memory, (str, Path, bool)):
         if not memory:
             return None
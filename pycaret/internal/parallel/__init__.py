@@ -1 +1,2 @@
+from .joblib_backend import JoblibBackend
 from .parallel_backend import ParallelBackend
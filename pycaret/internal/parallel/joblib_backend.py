@@ -0,0 +1,154 @@
+import sys
+from typing import Any, Dict, List, Optional, Union
+
+import joblib
+import pandas as pd
+
+from pycaret.internal.logging import get_logger
+from pycaret.internal.parallel.parallel_backend import ParallelBackend
+
+logger = get_logger()
+
+_SUPPORTED_BACKENDS = ("auto", "ray", "dask")
+
+# Name of the backend made default by ``register_cluster_backend``, if any
+_ACTIVE_BACKEND: Optional[str] = None
+
+
+def _ray_is_running() -> bool:
+    # Only look at ray if it was already imported, never start a cluster
+    ray = sys.modules.get("ray")
+    return ray is not None and ray.is_initialized()
+
+
+def _dask_is_running() -> bool:
+    distributed = sys.modules.get("distributed")
+    if distributed is None:
+        return False
+    try:
+        distributed.get_client()
+    except ValueError:
+        return False
+    return True
+
+
+def register_cluster_backend(parallel_backend: Optional[str] = "auto") -> Optional[str]:
+    """Make a distributed joblib backend the default when a cluster is live.
+
+    Nested ``joblib.Parallel`` calls (cross validation, ``compare_models``)
+    then run on the cluster without any change from the caller.
+
+    parallel_backend: str or None, default = "auto"
+        - If None: Leave joblib's default backend untouched.
+        - If "auto": Use ray if ``ray.init`` was called, else dask if a
+          ``distributed.Client`` exists, else the default backend.
+        - If "ray" or "dask": Only consider that cluster.
+
+    Returns:
+        Name of the activated backend, or None.
+
+    """
+    global _ACTIVE_BACKEND
+
+    if parallel_backend is None:
+        return None
+    if parallel_backend not in _SUPPORTED_BACKENDS:
+        raise ValueError(
+            f"Invalid value for the parallel_backend parameter, got "
+            f"{parallel_backend}. Possible values are: {_SUPPORTED_BACKENDS}."
+        )
+
+    backend = None
+    if parallel_backend in ("auto", "ray") and _ray_is_running():
+        from ray.util.joblib.ray_backend import RayBackend
+
+        joblib.register_parallel_backend("ray", RayBackend, make_default=True)
+        backend = "ray"
+    elif parallel_backend in ("auto", "dask") and _dask_is_running():
+        from joblib._dask import DaskDistributedBackend
+
+        joblib.register_parallel_backend(
+            "dask", DaskDistributedBackend, make_default=True
+        )
+        backend = "dask"
+    elif _ACTIVE_BACKEND is not None:
+        # The cluster used by a previous setup is gone, go back to loky
+        from joblib._parallel_backends import LokyBackend
+
+        joblib.register_parallel_backend("loky", LokyBackend, make_default=True)
+
+    if backend is not None:
+        logger.info(f"Using the {backend} joblib backend.")
+    elif parallel_backend != "auto":
+        logger.warning(f"No running {parallel_backend} cluster found.")
+
+    _ACTIVE_BACKEND = backend
+    return backend
+
+
+class JoblibBackend(ParallelBackend):
+    """Joblib backend for ``compare_models``.
+
+    Every estimator is cross validated in its own joblib worker, which
+    rebuilds the experiment from the setup parameters first.
+
+    Example
+    -------
+
+    >>> from pycaret.datasets import get_data
+    >>> from pycaret.internal.parallel import JoblibBackend
+    >>> from pycaret.regression import *
+    >>> boston = get_data('boston')
+    >>> exp_name = setup(data = boston,  target = 'medv')
+    >>> best_model = compare_models(parallel=JoblibBackend())
+
+
+    n_jobs: int, default = -1
+        Number of joblib workers. -1 means using all processors.
+
+    backend: str, default = "loky"
+        Joblib backend used to run the workers. When ``engine`` selects
+        sklearnex for any model, "threading" is used instead, since
+        sklearnex already parallelizes every fit.
+
+    """
+
+    def __init__(self, n_jobs: int = -1, backend: str = "loky"):
+        super().__init__()
+        self._n_jobs = n_jobs
+        self._backend = backend
+        self._params: Optional[Dict[str, Any]] = None
+
+    def compare_models(
+        self, instance: Any, params: Dict[str, Any]
+    ) -> Union[Any, List[Any]]:
+        self._params = dict(params)
+        sort_col, asc = instance._process_sort(self._params["sort"])
+
+        backend = self._backend
+        if "sklearnex" in (self._params.get("engine") or {}).values():
+            backend = "threading"
+
+        outputs = joblib.Parallel(n_jobs=self._n_jobs, backend=backend)(
+            joblib.delayed(self._remote_compare_models)(estimator)
+            for estimator in self._params["include"]
+        )
+        outputs = [(res, model) for res, model in outputs if len(res) > 0]
+        if not outputs:
+            raise RuntimeError("No model could be trained by compare_models.")
+
+        res = pd.concat(res.assign(_model=[model]) for res, model in outputs)
+        res = res.sort_values(sort_col, ascending=asc)
+        instance._display_container.append(res.iloc[:, :-1])
+        top_models = list(res.head(self._params.get("n_select", 1))._model)
+        return top_models[0] if len(top_models) == 1 else top_models
+
+    def _remote_compare_models(self, estimator: Any) -> tuple:
+        instance = self.remote_setup()
+        params = dict(self._params)
+        params.pop("include")
+        params["verbose"] = False
+        params["n_select"] = 1
+
+        model = instance.compare_models(include=[estimator], **params)
+        return instance.pull()[:1], model
@@ -11,6 +11,15 @@ from sklearn.pipeline import Pipeline
 from pycaret.utils._dependencies import _check_soft_dependencies
 from pycaret.utils.generic import MLUsecase, get_logger
 
+# Parallel multipart transfers for large pipelines on S3 / Azure
+_TRANSFER_CONCURRENCY = 10
+_S3_TRANSFER_CONFIG = dict(
+    multipart_threshold=64 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=_TRANSFER_CONCURRENCY,
+    use_threads=True,
+)
+
 
 def deploy_model(
     model, model_name: str, authentication: dict, platform: str = "aws", prep_pipe_=None
@@ -155,9 +164,15 @@ def deploy_model(
             )
 
         import botocore.exceptions
+        from boto3.s3.transfer import TransferConfig
 
         try:
-            s3.upload_file(filename, bucket_name, key)
+            s3.upload_file(
+                filename,
+                bucket_name,
+                key,
+                Config=TransferConfig(**_S3_TRANSFER_CONFIG),
+            )
         except botocore.exceptions.NoCredentialsError:
             logger.error(
                 "Boto3 credentials not configured. Refer boto3 documentation "
@@ -420,16 +435,19 @@ def load_model(
         else:
             key = filename
 
+        from boto3.s3.transfer import TransferConfig
+
         index = filename.rfind("/")
         s3 = boto3.resource("s3")
+        config = TransferConfig(**_S3_TRANSFER_CONFIG)
 
         if index == -1:
-            s3.Bucket(bucketname).download_file(key, filename)
+            s3.Bucket(bucketname).download_file(key, filename, Config=config)
         else:
             path, key = filename[: index + 1], filename[index + 1 :]
             if not os.path.exists(path):
                 os.makedirs(path)
-            s3.Bucket(bucketname).download_file(key, filename)
+            s3.Bucket(bucketname).download_file(key, filename, Config=config)
 
         model = load_model(model_name, verbose=False)
 
@@ -743,7 +761,9 @@ def _upload_blob_azure(
 
     # Upload the created file
     with open(source_file_name, "rb") as data:
-        blob_client.upload_blob(data, overwrite=True)
+        blob_client.upload_blob(
+            data, overwrite=True, max_concurrency=_TRANSFER_CONCURRENCY
+        )
 
 
 def _download_blob_azure(
@@ -790,4 +810,6 @@ def _download_blob_azure(
 
     if destination_file_name is not None:
         with open(destination_file_name, "wb") as download_file:
-            download_file.write(blob_client.download_blob().readall())
+            blob_client.download_blob(
+                max_concurrency=_TRANSFER_CONCURRENCY
+            ).readinto(download_file)
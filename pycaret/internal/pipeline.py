@@ -26,6 +26,22 @@ from pycaret.utils.generic import get_all_object_vars_and_properties, variable_r
 
 INVERSE_ONLY = False
 
+# Steps cached when setup is called with memory="auto". The remaining steps
+# (scalers, simple imputers, ...) are faster to refit than to hash.
+AUTO_MEMOIZED_STEPS = frozenset(
+    {
+        "iterative_imputer",
+        "text_embedding",
+        "rest_encoding",
+        "remove_multicollinearity",
+        "bin_numeric_features",
+        "remove_outliers",
+        "balance",
+        "pca",
+        "feature_selection",
+    }
+)
+
 
 def _copy_estimator_state(source, target) -> None:
     """Copy the state of source to target."""
@@ -107,8 +123,8 @@ def _fit_transform_one(transformer, X=None, y=None, message=None, params=None):
 
 
 def _full_transform(pipeline: "Pipeline", X, y, **kwargs):
-    for _, _, transformer in pipeline._iter(**kwargs):
-        X, y = pipeline._memory_transform(transformer, X, y)
+    for _, name, transformer in pipeline._iter(**kwargs):
+        X, y = pipeline._step_memory(name)[1](transformer, X, y)
     return X, y
 
 
@@ -117,8 +133,10 @@ def _noop_transform(pipeline: "Pipeline", X, y, **kwargs):
 
 
 class Pipeline(imblearn.pipeline.Pipeline):
-    def __init__(self, steps, *, memory=None, verbose=False):
+    def __init__(self, steps, *, memory=None, verbose=False, memoize_steps=None):
         super().__init__(steps, memory=memory, verbose=verbose)
+        # Names of the steps that go through memory, None caches all of them
+        self.memoize_steps = memoize_steps
         self._fit_vars = set()
         self._feature_names_in = None
         self._cache_full_transform = True
@@ -184,11 +202,22 @@ class Pipeline(imblearn.pipeline.Pipeline):
         self._memory_transform = self._memory.cache(_transform_one)
         self.__memory_full_transform = self._memory.cache(_full_transform)
 
+    def _step_memory(self, name):
+        """Return the (fit, transform) functions to use for step ``name``."""
+        if getattr(self, "memoize_steps", None) is None or name in self.memoize_steps:
+            return self._memory_fit, self._memory_transform
+        return _fit_one, _transform_one
+
     @property
     def _memory_full_transform(self):
         if INVERSE_ONLY:
             return _noop_transform
-        if self._cache_full_transform:
+        if next(
+            iter(self._iter(with_final=False, filter_train_only=False)), None
+        ) is None and not hasattr(self._final_estimator, "transform"):
+            # Nothing to transform (e.g. preprocess=False), don't hash the data
+            return _noop_transform
+        if self._cache_full_transform and getattr(self, "memoize_steps", None) is None:
             return self.__memory_full_transform
         else:
             return _full_transform
@@ -233,7 +262,8 @@ class Pipeline(imblearn.pipeline.Pipeline):
                     continue
 
             if hasattr(transformer, "transform"):
-                if self._memory_fit.__class__.__name__ == "NotMemorizedFunc":
+                memory_fit, memory_transform = self._step_memory(name)
+                if memory_fit.__class__.__name__ in ("NotMemorizedFunc", "function"):
                     # Don't clone when caching is disabled to
                     # preserve backward compatibility
                     cloned = transformer
@@ -244,14 +274,14 @@ class Pipeline(imblearn.pipeline.Pipeline):
                     cloned._cache_full_transform = False
 
                 # Fit or load the current transformer from cache
-                fitted_transformer = self._memory_fit(
+                fitted_transformer = memory_fit(
                     transformer=cloned,
                     X=X,
                     y=y,
                     message=self._log_message(step_idx),
                     params=routed_params.get(name, {}),
                 )
-                X, y = self._memory_transform(
+                X, y = memory_transform(
                     transformer=fitted_transformer,
                     X=X,
                     y=y,
@@ -2,6 +2,7 @@
 # License: MIT
 
 from copy import deepcopy
+from importlib import import_module
 
 import numpy as np
 import pandas as pd
@@ -70,6 +71,7 @@ from pycaret.containers.models.regression import (
 from pycaret.internal.preprocess.iterative_imputer import IterativeImputer
 from pycaret.internal.preprocess.transformers import (
     CleanColumnNames,
+    ColumnwiseTransformer,
     DropImputer,
     EmbedTextFeatures,
     ExtractDateTimeFeatures,
@@ -82,6 +84,7 @@ from pycaret.internal.preprocess.transformers import (
     TransformerWrapper,
     TransformerWrapperWithInverse,
 )
+from pycaret.utils._dependencies import _check_soft_dependencies
 from pycaret.utils.constants import SEQUENCE
 from pycaret.utils.generic import (
     MLUsecase,
@@ -93,10 +96,41 @@ from pycaret.utils.generic import (
     to_series,
 )
 
+# cuML drop-in replacements for the sklearn transformers used in setup
+CUML_TRANSFORMERS = {
+    "SimpleImputer": "cuml.preprocessing",
+    "StandardScaler": "cuml.preprocessing",
+    "MinMaxScaler": "cuml.preprocessing",
+    "MaxAbsScaler": "cuml.preprocessing",
+    "RobustScaler": "cuml.preprocessing",
+    "PCA": "cuml.decomposition",
+    "IncrementalPCA": "cuml.decomposition",
+}
+
 
 class Preprocessor:
     """Class for all standard transformation steps."""
 
+    def _gpu_transformer(self, transformer):
+        """Swap a sklearn transformer for its cuML mirror when use_gpu=True."""
+        if not self.gpu_param:
+            return transformer
+
+        name = type(transformer).__name__
+        if name not in CUML_TRANSFORMERS:
+            self.logger.warning(f"No cuML equivalent for {name}, running on CPU.")
+            return transformer
+
+        if not _check_soft_dependencies("cuml", extra=None, severity="warning"):
+            return transformer
+
+        try:
+            module = import_module(CUML_TRANSFORMERS[name])
+            return getattr(module, name)(**transformer.get_params())
+        except Exception:
+            self.logger.warning(f"Couldn't create cuML {name}, running on CPU.")
+            return transformer
+
     def _prepare_dataset(self, X, y=None):
         """Prepare the input data.
 
@@ -118,8 +152,11 @@ class Preprocessor:
         """
         self.logger.info("Set up data.")
 
-        # Make copy to not overwrite mutable arguments
-        X = to_df(deepcopy(X))
+        # Make copy to not overwrite mutable arguments. Python containers and
+        # columnar objects are always rebuilt by to_df, so they are not copied
+        if not isinstance(X, (list, tuple, dict)) and not hasattr(X, "to_pandas"):
+            X = deepcopy(X)
+        X = to_df(X)
 
         # No duplicate column names are allowed
         if len(set(X.columns)) != len(X.columns):
@@ -404,6 +441,7 @@ class Preprocessor:
         """Power transform the data to be more Gaussian-like."""
         self.logger.info("Set up target transformation.")
 
+        # the target is a single column, nothing to spread over threads
         if transformation_method == "yeo-johnson":
             transformation_estimator = PowerTransformer(
                 method="yeo-johnson", standardize=False, copy=True
@@ -433,7 +471,7 @@ class Preprocessor:
         """Convert date features to numerical values."""
         self.logger.info("Set up date feature engineering.")
         date_estimator = TransformerWrapper(
-            transformer=ExtractDateTimeFeatures(create_date_columns),
+            transformer=ExtractDateTimeFeatures(tuple(create_date_columns)),
             include=self._fxs["Date"],
         )
         self.pipeline.steps.append(
@@ -458,7 +496,9 @@ class Preprocessor:
                 )
             elif numeric_imputation.lower() in num_dict:
                 num_estimator = TransformerWrapper(
-                    SimpleImputer(strategy=num_dict[numeric_imputation.lower()]),
+                    self._gpu_transformer(
+                        SimpleImputer(strategy=num_dict[numeric_imputation.lower()])
+                    ),
                     include=self._fxs["Numeric"],
                 )
             else:
@@ -468,7 +508,9 @@ class Preprocessor:
                 )
         else:
             num_estimator = TransformerWrapper(
-                SimpleImputer(strategy="constant", fill_value=numeric_imputation),
+                self._gpu_transformer(
+                    SimpleImputer(strategy="constant", fill_value=numeric_imputation)
+                ),
                 include=self._fxs["Numeric"],
             )
 
@@ -881,8 +923,11 @@ class Preprocessor:
         self.logger.info("Set up column transformation.")
 
         if transformation_method == "yeo-johnson":
-            transformation_estimator = PowerTransformer(
-                method="yeo-johnson", standardize=False, copy=True
+            transformation_estimator = ColumnwiseTransformer(
+                transformer=PowerTransformer(
+                    method="yeo-johnson", standardize=False, copy=True
+                ),
+                n_jobs=self.n_jobs_param,
             )
         elif transformation_method == "quantile":
             transformation_estimator = QuantileTransformer(
@@ -911,7 +956,9 @@ class Preprocessor:
             "robust": RobustScaler(),
         }
         if normalize_method in norm_dict:
-            normalize_estimator = TransformerWrapper(norm_dict[normalize_method])
+            normalize_estimator = TransformerWrapper(
+                self._gpu_transformer(norm_dict[normalize_method])
+            )
         else:
             raise ValueError(
                 "Invalid value for the normalize_method parameter, got "
@@ -931,7 +978,7 @@ class Preprocessor:
         }
         if pca_method in pca_dict:
             pca_estimator = TransformerWrapper(
-                transformer=pca_dict[pca_method],
+                transformer=self._gpu_transformer(pca_dict[pca_method]),
                 exclude=self._fxs["Keep"],
             )
         else:
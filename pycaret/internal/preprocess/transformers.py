@@ -8,6 +8,7 @@ from inspect import signature
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from pandas.api.types import is_numeric_dtype
 from scipy import stats
 from sklearn.base import BaseEstimator, TransformerMixin, clone
@@ -15,6 +16,7 @@ from sklearn.covariance import EllipticEnvelope
 from sklearn.ensemble import IsolationForest
 from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
 from sklearn.neighbors import LocalOutlierFactor
+from threadpoolctl import threadpool_limits
 
 from pycaret.utils.generic import to_df, to_series, variable_return
 
@@ -130,9 +132,11 @@ class TransformerWrapper(BaseEstimator, TransformerMixin):
                     "already exists in the original dataset."
                 )
 
-        # Force new indices on old dataset for merge
+        # Force new indices on old dataset for merge. The original dataframe
+        # can be the caller's data (to_df doesn't copy), so don't set it inplace
         try:
-            original_df.index = df.index
+            if not original_df.index.equals(df.index):
+                original_df = original_df.set_axis(df.index)
         except ValueError:  # Length mismatch
             raise IndexError(
                 f"Length of values ({len(df)}) does not match length of "
@@ -289,30 +293,57 @@ class CleanColumnNames(BaseEstimator, TransformerMixin):
         return X.rename(columns=lambda x: re.sub(self.match, "", str(x)))
 
 
+def _datetime_field(column, fx):
+    """Get a datetime attribute, computing day, month and year in numpy."""
+    if fx not in ("day", "month", "year") or not isinstance(column.dtype, np.dtype):
+        return getattr(column.dt, fx)
+
+    values = column.to_numpy()
+    years = values.astype("datetime64[Y]")
+    if fx == "year":
+        field = years.astype(np.int64) + 1970
+    elif fx == "month":
+        field = (values.astype("datetime64[M]") - years).astype(np.int64) + 1
+    else:
+        months = values.astype("datetime64[M]")
+        field = (values.astype("datetime64[D]") - months).astype(np.int64) + 1
+
+    nat = np.isnat(values)
+    if nat.any():
+        field = field.astype(float)
+        field[nat] = np.nan
+    else:
+        field = field.astype(np.int32)
+
+    return pd.Series(field, index=column.index, name=column.name)
+
+
 class ExtractDateTimeFeatures(BaseEstimator, TransformerMixin):
     """Extract features from datetime columns."""
 
-    def __init__(self, features=["day", "month", "year"]):
+    def __init__(self, features=("day", "month", "year")):
         self.features = features
 
     def fit(self, X, y=None):
         return self
 
     def transform(self, X, y=None):
+        features = {}
         for col in X:
             if not X[col].dtype.name.startswith("datetime"):
                 raise TypeError(f"Column {col} has no dtype datetime64!")
 
-            for fx in self.features:
-                values = getattr(X[col].dt, fx)
+            # Reversed to keep the column order of inserting each feature
+            # right after the original column
+            for fx in reversed(self.features):
+                values = _datetime_field(X[col], fx)
 
                 # Only create feature if values contains less than 10% NaTs
                 if values.isna().sum() <= 0.1 * len(values):
-                    X.insert(X.columns.get_loc(col) + 1, f"{col}_{fx}", values)
-
-            X = X.drop(col, axis=1)  # Drop the original datetime column
+                    features[f"{col}_{fx}"] = values
 
-        return X
+        # The original datetime columns are dropped
+        return pd.DataFrame(features, index=X.index)
 
 
 class DropImputer(BaseEstimator, TransformerMixin):
@@ -432,6 +463,45 @@ class GroupFeatures(BaseEstimator, TransformerMixin):
         return X
 
 
+class ColumnwiseTransformer(BaseEstimator, TransformerMixin):
+    """Fit a clone of a transformer on every column in parallel.
+
+    Meant for transformers that treat every column independently,
+    e.g. the yeo-johnson PowerTransformer, which optimizes one lambda
+    per column. The columns are dispatched to joblib threads.
+
+    """
+
+    def __init__(self, transformer, n_jobs=None):
+        self.transformer = transformer
+        self.n_jobs = n_jobs
+
+    def fit(self, X, y=None):
+        self.feature_names_in_ = np.asarray(X.columns, dtype=object)
+        self.n_features_in_ = len(self.feature_names_in_)
+        # The BLAS limit is process-wide state, so it's set once around all
+        # the workers instead of entered and restored concurrently per thread
+        with threadpool_limits(limits=1, user_api="blas"):
+            self.transformers_ = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+                delayed(clone(self.transformer).fit)(X[[col]]) for col in X
+            )
+        return self
+
+    def transform(self, X, y=None):
+        return np.hstack(
+            [t.transform(X[[col]]) for t, col in zip(self.transformers_, X)]
+        )
+
+    def inverse_transform(self, X, y=None):
+        X = np.asarray(X)
+        return np.hstack(
+            [t.inverse_transform(X[:, [i]]) for i, t in enumerate(self.transformers_)]
+        )
+
+    def get_feature_names_out(self, input_features=None):
+        return self.feature_names_in_
+
+
 class RemoveMulticollinearity(BaseEstimator, TransformerMixin):
     """Drop multicollinear features."""
 
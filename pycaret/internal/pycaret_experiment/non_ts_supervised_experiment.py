@@ -32,34 +32,46 @@ class _NonTSSupervisedExperiment(_SupervisedExperiment):
     @property
     def dataset_transformed(self):
         """Transformed dataset."""
-        return pd.concat([self.train_transformed, self.test_transformed])
+        return pd.concat(
+            [self._transform_split("train"), self._transform_split("test")]
+        )
+
+    def _transform_split(self, split: str) -> pd.DataFrame:
+        """Transform the train or test set, reusing the last result.
+
+        The result is kept while the pipeline, data and split indices
+        are the same objects, so e.g. reading X_test_transformed and
+        y_test_transformed for a plot runs the pipeline only once.
+        The returned frame is shared, don't modify it inplace. The
+        public properties hand out copies or new frames built from it.
+
+        """
+        key = (self.pipeline, self.data, self.idx)
+        cache = self.__dict__.setdefault("_transformed_cache", {})
+        cached = cache.get(split)
+        if cached is not None and all(a is b for a, b in zip(cached[0], key)):
+            return cached[1]
+
+        if split == "train":
+            X, y = self.pipeline.transform(
+                X=self.X_train, y=self.y_train, filter_train_only=False
+            )
+        else:
+            X, y = self.pipeline.transform(X=self.X_test, y=self.y_test)
+
+        transformed = pd.concat([X, y], axis=1)
+        cache[split] = (key, transformed)
+        return transformed
 
     @property
     def train_transformed(self):
         """Transformed training set."""
-        return pd.concat(
-            [
-                *self.pipeline.transform(
-                    X=self.X_train,
-                    y=self.y_train,
-                    filter_train_only=False,
-                )
-            ],
-            axis=1,
-        )
+        return self._transform_split("train").copy()
 
     @property
     def test_transformed(self):
         """Transformed test set."""
-        return pd.concat(
-            [
-                *self.pipeline.transform(
-                    X=self.X_test,
-                    y=self.y_test,
-                )
-            ],
-            axis=1,
-        )
+        return self._transform_split("test").copy()
 
     @property
     def X_transformed(self):
@@ -74,22 +86,22 @@ class _NonTSSupervisedExperiment(_SupervisedExperiment):
     @property
     def X_train_transformed(self):
         """Transformed feature set of the training set."""
-        return self.train_transformed.drop(self.target_param, axis=1)
+        return self._transform_split("train").drop(self.target_param, axis=1)
 
     @property
     def y_train_transformed(self):
         """Transformed target column of the training set."""
-        return self.train_transformed[self.target_param]
+        return self._transform_split("train")[self.target_param].copy()
 
     @property
     def X_test_transformed(self):
         """Transformed feature set of the test set."""
-        return self.test_transformed.drop(self.target_param, axis=1)
+        return self._transform_split("test").drop(self.target_param, axis=1)
 
     @property
     def y_test_transformed(self):
         """Transformed target column of the test set."""
-        return self.test_transformed[self.target_param]
+        return self._transform_split("test")[self.target_param].copy()
 
     def _create_model_get_train_X_y(self, X_train, y_train):
         """Return appropriate training X and y values depending on whether
@@ -1,7 +1,9 @@
 import inspect
+import io
 import os
 import warnings
 from collections import defaultdict
+from importlib.util import find_spec
 from typing import Any, BinaryIO, Callable, Dict, Optional, Union
 
 import cloudpickle
@@ -11,11 +13,49 @@ import pycaret.internal.patches.sklearn
 import pycaret.internal.patches.yellowbrick
 import pycaret.internal.persistence
 from pycaret.internal.logging import get_logger
+from pycaret.utils._dependencies import _check_soft_dependencies
 from pycaret.utils.constants import DATAFRAME_LIKE
 from pycaret.utils.generic import LazyExperimentMapping
 
 LOGGER = get_logger()
 
+# Every zstd frame starts with these bytes, which lets load_experiment
+# tell compressed files apart from plain cloudpickle ones
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _is_zstd_stream(f: BinaryIO) -> bool:
+    if hasattr(f, "peek"):
+        head = f.peek(len(_ZSTD_MAGIC))[: len(_ZSTD_MAGIC)]
+    else:
+        head = f.read(len(_ZSTD_MAGIC))
+        f.seek(-len(head), os.SEEK_CUR)
+    return head == _ZSTD_MAGIC
+
+
+def _cloudpickle_load(f: BinaryIO, **cloudpickle_kwargs):
+    if not _is_zstd_stream(f):
+        return cloudpickle.load(f, **cloudpickle_kwargs)
+
+    _check_soft_dependencies("zstandard", extra=None, severity="error")
+    import zstandard
+
+    with zstandard.ZstdDecompressor().stream_reader(f, closefd=False) as zf:
+        # Buffered so that pickle gets the readline it expects
+        return cloudpickle.load(io.BufferedReader(zf), **cloudpickle_kwargs)
+
+
+def _cloudpickle_dump(obj, f: BinaryIO, **cloudpickle_kwargs) -> None:
+    if not find_spec("zstandard"):
+        cloudpickle.dump(obj, f, **cloudpickle_kwargs)
+        return
+
+    import zstandard
+
+    compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+    with compressor.stream_writer(f, closefd=False) as zf:
+        cloudpickle.dump(obj, zf, **cloudpickle_kwargs)
+
 
 class _PyCaretExperiment:
     # Will not include those attributes in the pickle file
@@ -402,15 +442,13 @@ class _PyCaretExperiment:
         **kwargs,
     ):
         cloudpickle_kwargs = cloudpickle_kwargs or {}
-        try:
-            loaded_exp: _PyCaretExperiment = cloudpickle.load(
-                path_or_file, **cloudpickle_kwargs
-            )
-        except TypeError:
+        if isinstance(path_or_file, (str, os.PathLike)):
             with open(path_or_file, mode="rb") as f:
-                loaded_exp: _PyCaretExperiment = cloudpickle.load(
+                loaded_exp: _PyCaretExperiment = _cloudpickle_load(
                     f, **cloudpickle_kwargs
                 )
+        else:
+            loaded_exp = _cloudpickle_load(path_or_file, **cloudpickle_kwargs)
         original_state = loaded_exp.__dict__.copy()
         new_params = kwargs
         setup_params = loaded_exp._setup_params or {}
@@ -461,6 +499,7 @@ class _PyCaretExperiment:
         path_or_file: str or BinaryIO (file pointer)
             The path/file pointer to load the experiment from.
             The pickle file must be created through ``save_experiment``.
+            zstd-compressed files are detected automatically.
 
 
         data: dataframe-like
@@ -511,9 +550,10 @@ class _PyCaretExperiment:
         Saves the experiment to a pickle file.
 
         The experiment is saved using cloudpickle to deal with lambda
-        functions. The data or test data is NOT saved with the experiment
-        and will need to be specified again when loading using
-        ``load_experiment``.
+        functions. If ``zstandard`` is installed, the pickle is streamed
+        through a zstd compressor. The data or test data is NOT saved with
+        the experiment and will need to be specified again when loading
+        using ``load_experiment``.
 
 
         path_or_file: str or BinaryIO (file pointer)
@@ -528,11 +568,11 @@ class _PyCaretExperiment:
             None
 
         """
-        try:
-            cloudpickle.dump(self, path_or_file, **cloudpickle_kwargs)
-        except TypeError:
+        if isinstance(path_or_file, (str, os.PathLike)):
             with open(path_or_file, mode="wb") as f:
-                cloudpickle.dump(self, f, **cloudpickle_kwargs)
+                _cloudpickle_dump(self, f, **cloudpickle_kwargs)
+        else:
+            _cloudpickle_dump(self, path_or_file, **cloudpickle_kwargs)
 
     def pull(self, pop=False) -> pd.DataFrame:  # added in pycaret==2.2.0
         """
@@ -4,7 +4,6 @@ import os
 import time
 import traceback
 import warnings
-import streamlit as st
 from abc import abstractmethod
 from copy import copy, deepcopy
 from functools import partial
@@ -83,6 +82,11 @@ LOGGER = get_logger()
 
 class _SupervisedExperiment(_TabularExperiment):
     _create_app_predict_kwargs = {}
+    _attributes_to_not_save = _TabularExperiment._attributes_to_not_save + [
+        "_tree_explainer",
+        "_shap_values",
+        "_transformed_cache",
+    ]
 
     def __init__(self) -> None:
         super().__init__()
@@ -306,6 +310,31 @@ class _SupervisedExperiment(_TabularExperiment):
         greater_is_worse_columns.add("TT (Sec)")
         return greater_is_worse_columns
 
+    def _build_compare_models_grid(
+        self,
+        score_rows: List[pd.DataFrame],
+        sort: str,
+        sort_ascending: bool,
+        round: int,
+        results_columns_to_ignore: List[str],
+    ) -> Tuple[pd.DataFrame, Any]:
+        """Concatenate the per-model score rows of compare_models once and
+        return the sorted grid together with its styled version.
+        """
+        master_display = pd.concat(score_rows, ignore_index=False).round(round)
+        if self._ml_usecase == MLUsecase.TIME_SERIES:
+            sort = sort.upper()
+        master_display = master_display.sort_values(by=sort, ascending=sort_ascending)
+
+        master_display_ = master_display.drop(
+            results_columns_to_ignore, axis=1, errors="ignore"
+        ).style.format(precision=round)
+        master_display_ = master_display_.set_properties(**{"text-align": "left"})
+        master_display_ = master_display_.set_table_styles(
+            [dict(selector="th", props=[("text-align", "left")])]
+        )
+        return master_display, master_display_
+
     def _highlight_models(self, master_display_: Any) -> Any:
         def highlight_max(s):
             to_highlight = s == s.max()
@@ -494,6 +523,8 @@ class _SupervisedExperiment(_TabularExperiment):
             you can use ``FugueBackend(session)`` to make this function running using
             Spark. For more details, see
             :class:`~pycaret.parallel.fugue_backend.FugueBackend`
+            To use all local cores, pass ``JoblibBackend()`` from
+            :mod:`pycaret.internal.parallel`.
 
 
         caller_params: dict, default = None
@@ -727,6 +758,7 @@ class _SupervisedExperiment(_TabularExperiment):
 
         master_display = None
         master_display_ = None
+        score_rows = []
 
         total_runtime_start = time.time()
         total_runtime = 0
@@ -734,6 +766,8 @@ class _SupervisedExperiment(_TabularExperiment):
         if budget_time and budget_time > 0:
             self.logger.info(f"Time budget is {budget_time} minutes")
 
+        import streamlit as st
+
         for i, model in enumerate(model_library):
             model_id = (
                 model
@@ -868,37 +902,24 @@ class _SupervisedExperiment(_TabularExperiment):
             compare_models_.insert(0, "Object", [model])
             compare_models_.insert(0, "runtime", runtime)
             compare_models_.index = [model_id]
-            if master_display is None:
-                master_display = compare_models_
-            else:
-                master_display = pd.concat(
-                    [master_display, compare_models_], ignore_index=False
-                )
-            master_display = master_display.round(round)
-            if self._ml_usecase != MLUsecase.TIME_SERIES:
-                master_display = master_display.sort_values(
-                    by=sort, ascending=sort_ascending
-                )
-            else:
-                master_display = master_display.sort_values(
-                    by=sort.upper(), ascending=sort_ascending
-                )
-
-            master_display_ = master_display.drop(
-                results_columns_to_ignore, axis=1, errors="ignore"
-            ).style.format(precision=round)
-            master_display_ = master_display_.set_properties(**{"text-align": "left"})
-            master_display_ = master_display_.set_table_styles(
-                [dict(selector="th", props=[("text-align", "left")])]
-            )
+            score_rows.append(compare_models_)
 
+            # Only rebuild the grid in the loop when it can be shown
             if display.can_update_text:
+                master_display, master_display_ = self._build_compare_models_grid(
+                    score_rows, sort, sort_ascending, round, results_columns_to_ignore
+                )
                 display.display(master_display_, final_display=False)
 
             st.toast(f"Finished training :blue[{model_name}]", icon="✅")
 
         display.move_progress()
 
+        if score_rows:
+            master_display, master_display_ = self._build_compare_models_grid(
+                score_rows, sort, sort_ascending, round, results_columns_to_ignore
+            )
+
         compare_models_ = self._highlight_models(master_display_)
 
         display.update_monitor(1, "Compiling Final Models")
@@ -2278,6 +2299,9 @@ class _SupervisedExperiment(_TabularExperiment):
             model = clone(estimator_definition.tunable(**estimator.get_params()))
 
         base_estimator = model
+
+        import streamlit as st
+
         st.toast(f"Fine Tuning :blue[{estimator_name}]", icon="⚙️")
         with st.spinner(
             f"Fine tuning :blue[{estimator_name}]{'' if 'MLP' not in estimator_name else ', this may take a while...'}"
@@ -3960,6 +3984,56 @@ class _SupervisedExperiment(_TabularExperiment):
         gc.collect()
         return model
 
+    def _get_tree_explainer(self, model):
+        """Get a SHAP tree explainer for the model, reusing the last one.
+
+        With use_gpu, GPUTreeShap is tried first. It falls back to the
+        CPU TreeExplainer when shap was built without CUDA or the model
+        is not supported (e.g. trees deeper than 32).
+        """
+        import shap
+
+        cached = getattr(self, "_tree_explainer", None)
+        if cached is not None and cached[0] is model:
+            return cached[1]
+
+        explainer = None
+        if self.gpu_param:
+            try:
+                explainer = shap.explainers.GPUTree(model)
+                self.logger.info("Using GPUTree explainer")
+            except Exception:
+                self.logger.warning("Couldn't create GPUTree explainer, using CPU.")
+
+        if explainer is None:
+            explainer = shap.TreeExplainer(model)
+
+        self._tree_explainer = (model, explainer)
+        return explainer
+
+    def _get_shap_values(self, explainer, X: pd.DataFrame, source=None):
+        """Compute the shap values of X, reusing the last ones.
+
+        ``source`` is the transformed train/test frame X was taken from.
+        The values are reused while both the explainer and source are the
+        same objects, so calling interpret_model(plot="reason") for one
+        observation after another explains the set once. Pass None (e.g.
+        for X_new_sample) to always compute them.
+        """
+        cached = getattr(self, "_shap_values", None)
+        if (
+            source is not None
+            and cached is not None
+            and cached[0] is explainer
+            and cached[1] is source
+        ):
+            return cached[2]
+
+        shap_values = explainer.shap_values(X)
+        if source is not None:
+            self._shap_values = (explainer, source, shap_values)
+        return shap_values
+
     def interpret_model(
         self,
         estimator,
@@ -4120,6 +4194,7 @@ class _SupervisedExperiment(_TabularExperiment):
         """
 
         # Storing X_train and y_train in data_X and data_y parameter
+        source = None
         if X_new_sample is not None:
             test_X = self.pipeline.transform(X_new_sample)
             if plot == "pfi":
@@ -4127,8 +4202,10 @@ class _SupervisedExperiment(_TabularExperiment):
         else:
             # Storing X_train and y_train in data_X and data_y parameter
             if use_train_data:
+                source = self._transform_split("train")
                 test_X = self.X_train_transformed
             else:
+                source = self._transform_split("test")
                 test_X = self.X_test_transformed
             if plot == "pfi":
                 if use_train_data:
@@ -4151,9 +4228,9 @@ class _SupervisedExperiment(_TabularExperiment):
 
         def summary(show: bool = True):
             self.logger.info("Creating TreeExplainer")
-            explainer = shap.TreeExplainer(model)
+            explainer = self._get_tree_explainer(model)
             self.logger.info("Compiling shap values")
-            shap_values = explainer.shap_values(test_X)
+            shap_values = self._get_shap_values(explainer, test_X, source)
             try:
                 assert len(shap_values) == 2
                 shap_plot = shap.summary_plot(
@@ -4184,9 +4261,9 @@ class _SupervisedExperiment(_TabularExperiment):
                 dependence = feature
 
             self.logger.info("Creating TreeExplainer")
-            explainer = shap.TreeExplainer(model)
+            explainer = self._get_tree_explainer(model)
             self.logger.info("Compiling shap values")
-            shap_values = explainer.shap_values(test_X)
+            shap_values = self._get_shap_values(explainer, test_X, source)
 
             if model_id in shap_models_type1:
                 self.logger.info("model type detected: type 1")
@@ -4213,14 +4290,14 @@ class _SupervisedExperiment(_TabularExperiment):
                 self.logger.info("model type detected: type 1")
 
                 self.logger.info("Creating TreeExplainer")
-                explainer = shap.TreeExplainer(model)
+                explainer = self._get_tree_explainer(model)
                 self.logger.info("Compiling shap values")
 
                 if observation is None:
                     self.logger.warning(
                         "Observation set to None. Model agnostic plot will be rendered."
                     )
-                    shap_values = explainer.shap_values(test_X)
+                    shap_values = self._get_shap_values(explainer, test_X, source)
                     shap.initjs()
                     shap_plot = shap.force_plot(
                         explainer.expected_value[1], shap_values[1], test_X, **kwargs
@@ -4232,7 +4309,7 @@ class _SupervisedExperiment(_TabularExperiment):
 
                     if model_id == "lightgbm":
                         self.logger.info("model type detected: LGBMClassifier")
-                        shap_values = explainer.shap_values(test_X)
+                        shap_values = self._get_shap_values(explainer, test_X, source)
                         shap.initjs()
                         shap_plot = shap.force_plot(
                             explainer.expected_value[1],
@@ -4259,9 +4336,9 @@ class _SupervisedExperiment(_TabularExperiment):
                 self.logger.info("model type detected: type 2")
 
                 self.logger.info("Creating TreeExplainer")
-                explainer = shap.TreeExplainer(model)
+                explainer = self._get_tree_explainer(model)
                 self.logger.info("Compiling shap values")
-                shap_values = explainer.shap_values(test_X)
+                shap_values = self._get_shap_values(explainer, test_X, source)
                 shap.initjs()
 
                 if observation is None:
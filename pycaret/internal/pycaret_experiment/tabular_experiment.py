@@ -10,7 +10,6 @@ from unittest.mock import patch
 
 import numpy as np  # type: ignore
 import pandas as pd
-import plotly.express as px  # type: ignore
 import scikitplot as skplt  # type: ignore
 from IPython.display import display as ipython_display
 from joblib.memory import Memory
@@ -27,6 +26,7 @@ import pycaret.loggers
 from pycaret.internal.display import CommonDisplay
 from pycaret.internal.logging import create_logger, get_logger, redirect_output
 from pycaret.internal.memory import get_memory
+from pycaret.internal.pipeline import AUTO_MEMOIZED_STEPS
 from pycaret.internal.pipeline import Pipeline as InternalPipeline
 from pycaret.internal.plots.helper import MatplotlibDefaultDPI
 from pycaret.internal.plots.yellowbrick import show_yellowbrick_plot
@@ -299,6 +299,7 @@ class _TabularExperiment(_PyCaretExperiment):
         self.html_param = html
         self.logging_param = self._convert_log_experiment(log_experiment)
         self.memory = get_memory(memory)
+        self.memoize_steps = AUTO_MEMOIZED_STEPS if memory == "auto" else None
         self.verbose = verbose
 
         # Global attrs
@@ -663,6 +664,8 @@ class _TabularExperiment(_PyCaretExperiment):
 
                     self.logger.info("Rendering Visual")
 
+                    import plotly.express as px
+
                     if label:
                         fig = px.scatter(
                             pca_,
@@ -819,6 +822,8 @@ class _TabularExperiment(_PyCaretExperiment):
 
                     self.logger.info("Rendering Visual")
 
+                    import plotly.express as px
+
                     if label:
                         fig = px.scatter_3d(
                             df,
@@ -918,6 +923,8 @@ class _TabularExperiment(_PyCaretExperiment):
 
                     self.logger.info("Rendering Visual")
 
+                    import plotly.express as px
+
                     if label:
                         fig = px.scatter_3d(
                             df,
@@ -1010,6 +1017,8 @@ class _TabularExperiment(_PyCaretExperiment):
 
                     self.logger.info("Rendering Visual")
 
+                    import plotly.express as px
+
                     fig = px.histogram(
                         d,
                         x=x_col,
@@ -3,7 +3,7 @@ import gc
 import logging
 import time
 import traceback
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np  # type: ignore
 import pandas as pd
@@ -90,7 +90,7 @@ class _UnsupervisedExperiment(_TabularExperiment, Preprocessor):
         ignore_features: Optional[List[str]] = None,
         keep_features: Optional[List[str]] = None,
         preprocess: bool = True,
-        create_date_columns: List[str] = ["day", "month", "year"],
+        create_date_columns: Tuple[str, ...] = ("day", "month", "year"),
         imputation_type: Optional[str] = "simple",
         numeric_imputation: str = "mean",
         categorical_imputation: str = "mode",
@@ -225,7 +225,7 @@ class _UnsupervisedExperiment(_TabularExperiment, Preprocessor):
             when preprocess is set to False.
 
 
-        create_date_columns: list of str, default = ["day", "month", "year"]
+        create_date_columns: list or tuple of str, default = ("day", "month", "year")
             Columns to create from the date features. Note that created features
             with zero variance (e.g. the feature hour in a column that only contains
             dates) are ignored. Allowed values are datetime attributes from
@@ -488,6 +488,8 @@ class _UnsupervisedExperiment(_TabularExperiment, Preprocessor):
                 If False: No caching is performed.
                 If True: A default temp directory is used.
                 If str: Path to the caching directory.
+                If "auto": Like True, but only the expensive steps (iterative
+                imputation, text embedding, outlier removal, PCA, ...) are cached.
 
 
         profile: bool, default = False
@@ -573,6 +575,7 @@ class _UnsupervisedExperiment(_TabularExperiment, Preprocessor):
         self.pipeline = InternalPipeline(
             steps=[("placeholder", None)],
             memory=self.memory,
+            memoize_steps=self.memoize_steps,
         )
 
         if preprocess:
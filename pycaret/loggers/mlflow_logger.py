@@ -1,23 +1,18 @@
 import secrets
 from contextlib import contextmanager
+from importlib.util import find_spec
 
 from pycaret.loggers.base_logger import BaseLogger
 from pycaret.utils.generic import mlflow_remove_bad_chars
 
-try:
-    import mlflow
-    import mlflow.sklearn
-    from mlflow.tracking.fluent import _active_run_stack
-    from mlflow.utils.mlflow_tags import MLFLOW_PARENT_RUN_ID
-except ImportError:
-    mlflow = None
-    _active_run_stack = None
+# mlflow is slow to import, so it is only imported once a logger is used
 
 
 @contextmanager
 def set_active_mlflow_run(run):
     """Set active MLFlow run to ``run`` and then back to what it was."""
-    global _active_run_stack
+    from mlflow.tracking.fluent import _active_run_stack
+
     _active_run_stack.append(run)
     yield
     try:
@@ -29,7 +24,8 @@ def set_active_mlflow_run(run):
 @contextmanager
 def clean_active_mlflow_run():
     """Trick MLFLow into thinking there are no active runs."""
-    global _active_run_stack
+    from mlflow.tracking.fluent import _active_run_stack
+
     old_run_stack = _active_run_stack.copy()
     _active_run_stack.clear()
     yield
@@ -41,7 +37,7 @@ def clean_active_mlflow_run():
 
 class MlflowLogger(BaseLogger):
     def __init__(self) -> None:
-        if mlflow is None:
+        if find_spec("mlflow") is None:
             raise ImportError(
                 "MlflowLogger requires mlflow. Install using `pip install mlflow`"
             )
@@ -49,6 +45,8 @@ class MlflowLogger(BaseLogger):
         self.runs = []
 
     def init_experiment(self, exp_name_log, full_name=None, setup=True):
+        import mlflow
+
         full_name = full_name
         mlflow.set_experiment(exp_name_log)
         if setup:
@@ -69,6 +67,8 @@ class MlflowLogger(BaseLogger):
 
     @property
     def parent_run(self):
+        import mlflow
+
         if len(self.runs) < 2:
             return None
         # Get the setup with the same USI as the current run.
@@ -84,6 +84,8 @@ class MlflowLogger(BaseLogger):
         return self.active_run.info.run_id
 
     def finish_experiment(self):
+        import mlflow
+
         try:
             with set_active_mlflow_run(self.active_run):
                 mlflow.end_run()
@@ -92,15 +94,22 @@ class MlflowLogger(BaseLogger):
             pass
 
     def log_params(self, params, model_name=None):
+        import mlflow
+
         params = {mlflow_remove_bad_chars(k): v for k, v in params.items()}
         with set_active_mlflow_run(self.active_run):
             mlflow.log_params(params)
 
     def log_metrics(self, metrics, source=None):
+        import mlflow
+
         with set_active_mlflow_run(self.active_run):
             mlflow.log_metrics(metrics)
 
     def set_tags(self, source, experiment_custom_tags, runtime, USI=None):
+        import mlflow
+        from mlflow.utils.mlflow_tags import MLFLOW_PARENT_RUN_ID
+
         # Get active run to log as tag
         with set_active_mlflow_run(self.active_run):
             RunID = self.active_run.info.run_id
@@ -121,6 +130,8 @@ class MlflowLogger(BaseLogger):
                 mlflow.set_tag(MLFLOW_PARENT_RUN_ID, self.parent_run.info.run_id)
 
     def log_artifact(self, file, type="artifact"):
+        import mlflow
+
         with set_active_mlflow_run(self.active_run):
             mlflow.log_artifact(file)
 
@@ -131,6 +142,8 @@ class MlflowLogger(BaseLogger):
         self.log_artifact(html_file)
 
     def log_sklearn_pipeline(self, experiment, prep_pipe, model, path=None):
+        import mlflow
+
         # get default conda env
         from mlflow.sklearn import get_default_conda_env
 
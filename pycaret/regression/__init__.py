@@ -38,7 +38,17 @@ from pycaret.regression.functional import (
     stack_models,
     tune_model,
 )
-from pycaret.regression.oop import RegressionExperiment
+
+
+# RegressionExperiment is imported lazily so that importing the functional API
+# does not pull in the model containers up front.
+def __getattr__(name):
+    if name == "RegressionExperiment":
+        from pycaret.regression.oop import RegressionExperiment
+
+        return RegressionExperiment
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
 
 __all__ = [
     "RegressionExperiment",
@@ -1,24 +1,47 @@
+from __future__ import annotations
+
 import logging
 import os
-from typing import Any, BinaryIO, Callable, Dict, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pycaret.internal.parallel.joblib_backend import register_cluster_backend
+from pycaret.utils.generic import check_if_current_experiment
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from joblib.memory import Memory
+
+    from pycaret.internal.parallel.parallel_backend import ParallelBackend
+    from pycaret.loggers.base_logger import BaseLogger
+    from pycaret.regression.oop import RegressionExperiment
+    from pycaret.utils.constants import DATAFRAME_LIKE, SEQUENCE_LIKE, TARGET_LIKE
+
 
-import pandas as pd
-from joblib.memory import Memory
+def _get_experiment_class():
+    # imported on first use, RegressionExperiment pulls in the whole model zoo
+    from pycaret.regression.oop import RegressionExperiment
+
+    return RegressionExperiment
 
-from pycaret.internal.parallel.parallel_backend import ParallelBackend
-from pycaret.loggers.base_logger import BaseLogger
-from pycaret.regression.oop import RegressionExperiment
-from pycaret.utils.constants import DATAFRAME_LIKE, SEQUENCE_LIKE, TARGET_LIKE
-from pycaret.utils.generic import check_if_global_is_not_none
 
-_EXPERIMENT_CLASS = RegressionExperiment
 _CURRENT_EXPERIMENT: Optional[RegressionExperiment] = None
 _CURRENT_EXPERIMENT_EXCEPTION = (
     "_CURRENT_EXPERIMENT global variable is not set. Please run setup() first."
 )
-_CURRENT_EXPERIMENT_DECORATOR_DICT = {
-    "_CURRENT_EXPERIMENT": _CURRENT_EXPERIMENT_EXCEPTION
-}
+
+
+def _current_experiment():
+    return _CURRENT_EXPERIMENT
 
 
 def setup(
@@ -36,7 +59,7 @@ def setup(
     ignore_features: Optional[List[str]] = None,
     keep_features: Optional[List[str]] = None,
     preprocess: bool = True,
-    create_date_columns: List[str] = ["day", "month", "year"],
+    create_date_columns: Tuple[str, ...] = ("day", "month", "year"),
     imputation_type: Optional[str] = "simple",
     numeric_imputation: Union[int, float, str] = "mean",
     categorical_imputation: str = "mode",
@@ -95,6 +118,7 @@ def setup(
     memory: Union[bool, str, Memory] = True,
     profile: bool = False,
     profile_kwargs: Optional[Dict[str, Any]] = None,
+    parallel_backend: Optional[str] = "auto",
 ):
     """
     This function initializes the training environment and creates the transformation
@@ -200,7 +224,7 @@ def setup(
         when preprocess is set to False.
 
 
-    create_date_columns: list of str, default = ["day", "month", "year"]
+    create_date_columns: list or tuple of str, default = ("day", "month", "year")
         Columns to create from the date features. Note that created features
         with zero variance (e.g. the feature hour in a column that only contains
         dates) are ignored. Allowed values are datetime attributes from
@@ -574,6 +598,8 @@ def setup(
             If False: No caching is performed.
             If True: A default temp directory is used.
             If str: Path to the caching directory.
+            If "auto": Like True, but only the expensive steps (iterative
+            imputation, text embedding, outlier removal, PCA, ...) are cached.
 
     profile: bool, default = False
         When set to True, an interactive EDA report is displayed.
@@ -584,90 +610,33 @@ def setup(
         to create the EDA report. Ignored if ``profile`` is False.
 
 
+    parallel_backend: str or None, default = "auto"
+        joblib backend used by the parallel operations of the experiment when
+        ``n_jobs=-1`` and ``use_gpu=False``. With "auto", a running ray or dask
+        cluster is detected and made the default joblib backend. Use "ray" or
+        "dask" to only consider that cluster, or None to leave joblib as is.
+
+
     Returns:
-        Global variables that can be changed using the ``set_config`` function.
+        RegressionExperiment object.
+
+        Note: earlier versions of this module returned an ``(experiment, data)``
+        tuple whose second item was the ``data`` passed in. Code unpacking two
+        values must be updated; use ``get_config("dataset")`` for the data.
 
     """
-    exp = _EXPERIMENT_CLASS()
+    # locals() holds exactly the setup() parameters at this point
+    setup_params = locals().copy()
+    setup_params.pop("parallel_backend")
+    if n_jobs == -1 and use_gpu is False:
+        register_cluster_backend(parallel_backend)
+
+    exp = _get_experiment_class()()
     set_current_experiment(exp)
-    return exp.setup(
-        data=data,
-        data_func=data_func,
-        target=target,
-        index=index,
-        train_size=train_size,
-        test_data=test_data,
-        ordinal_features=ordinal_features,
-        numeric_features=numeric_features,
-        categorical_features=categorical_features,
-        date_features=date_features,
-        text_features=text_features,
-        ignore_features=ignore_features,
-        keep_features=keep_features,
-        preprocess=preprocess,
-        create_date_columns=create_date_columns,
-        imputation_type=imputation_type,
-        numeric_imputation=numeric_imputation,
-        categorical_imputation=categorical_imputation,
-        iterative_imputation_iters=iterative_imputation_iters,
-        numeric_iterative_imputer=numeric_iterative_imputer,
-        categorical_iterative_imputer=categorical_iterative_imputer,
-        text_features_method=text_features_method,
-        max_encoding_ohe=max_encoding_ohe,
-        encoding_method=encoding_method,
-        rare_to_value=rare_to_value,
-        rare_value=rare_value,
-        polynomial_features=polynomial_features,
-        polynomial_degree=polynomial_degree,
-        low_variance_threshold=low_variance_threshold,
-        group_features=group_features,
-        drop_groups=drop_groups,
-        remove_multicollinearity=remove_multicollinearity,
-        multicollinearity_threshold=multicollinearity_threshold,
-        bin_numeric_features=bin_numeric_features,
-        remove_outliers=remove_outliers,
-        outliers_method=outliers_method,
-        outliers_threshold=outliers_threshold,
-        transformation=transformation,
-        transformation_method=transformation_method,
-        normalize=normalize,
-        normalize_method=normalize_method,
-        pca=pca,
-        pca_method=pca_method,
-        pca_components=pca_components,
-        feature_selection=feature_selection,
-        feature_selection_method=feature_selection_method,
-        feature_selection_estimator=feature_selection_estimator,
-        n_features_to_select=n_features_to_select,
-        transform_target=transform_target,
-        transform_target_method=transform_target_method,
-        custom_pipeline=custom_pipeline,
-        custom_pipeline_position=custom_pipeline_position,
-        data_split_shuffle=data_split_shuffle,
-        data_split_stratify=data_split_stratify,
-        fold_strategy=fold_strategy,
-        fold=fold,
-        fold_shuffle=fold_shuffle,
-        fold_groups=fold_groups,
-        n_jobs=n_jobs,
-        use_gpu=use_gpu,
-        html=html,
-        session_id=session_id,
-        system_log=system_log,
-        log_experiment=log_experiment,
-        experiment_name=experiment_name,
-        experiment_custom_tags=experiment_custom_tags,
-        log_plots=log_plots,
-        log_profile=log_profile,
-        log_data=log_data,
-        verbose=verbose,
-        memory=memory,
-        profile=profile,
-        profile_kwargs=profile_kwargs,
-    ), data
+    return exp.setup(**setup_params)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def compare_models(
     include: Optional[List[Union[str, Any]]] = None,
     exclude: Optional[List[str]] = None,
@@ -788,6 +757,8 @@ def compare_models(
         you can use ``FugueBackend(session)`` to make this function running using
         Spark. For more details, see
         :class:`~pycaret.parallel.fugue_backend.FugueBackend`
+        To use all local cores, pass ``JoblibBackend()`` from
+        :mod:`pycaret.internal.parallel`.
 
 
     Returns:
@@ -822,7 +793,7 @@ def compare_models(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def get_allowed_engines(estimator: str) -> Optional[str]:
     """Get all the allowed engines for the specified model
     Parameters
@@ -840,7 +811,7 @@ def get_allowed_engines(estimator: str) -> Optional[str]:
     return _CURRENT_EXPERIMENT.get_allowed_engines(estimator=estimator)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def get_engine(estimator: str) -> Optional[str]:
     """Gets the model engine currently set in the experiment for the specified
     model.
@@ -859,7 +830,7 @@ def get_engine(estimator: str) -> Optional[str]:
     return _CURRENT_EXPERIMENT.get_engine(estimator=estimator)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def create_model(
     estimator: Union[str, Any],
     fold: Optional[Union[int, Any]] = None,
@@ -1002,7 +973,7 @@ def create_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def tune_model(
     estimator,
     fold: Optional[Union[int, Any]] = None,
@@ -1217,7 +1188,7 @@ def tune_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def ensemble_model(
     estimator,
     method: str = "Bagging",
@@ -1323,7 +1294,7 @@ def ensemble_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def blend_models(
     estimator_list: list,
     fold: Optional[Union[int, Any]] = None,
@@ -1426,7 +1397,7 @@ def blend_models(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def stack_models(
     estimator_list: list,
     meta_model=None,
@@ -1543,7 +1514,7 @@ def stack_models(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def plot_model(
     estimator,
     plot: str = "residuals",
@@ -1657,7 +1628,7 @@ def plot_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def evaluate_model(
     estimator,
     fold: Optional[Union[int, Any]] = None,
@@ -1724,7 +1695,7 @@ def evaluate_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def interpret_model(
     estimator,
     plot: str = "summary",
@@ -1834,7 +1805,7 @@ def interpret_model(
     )
 
 
-# not using check_if_global_is_not_none on purpose
+# not using check_if_current_experiment on purpose
 def predict_model(
     estimator,
     data: Optional[pd.DataFrame] = None,
@@ -1890,7 +1861,7 @@ def predict_model(
 
     experiment = _CURRENT_EXPERIMENT
     if experiment is None:
-        experiment = _EXPERIMENT_CLASS()
+        experiment = _get_experiment_class()()
 
     return experiment.predict_model(
         estimator=estimator,
@@ -1900,7 +1871,7 @@ def predict_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def finalize_model(
     estimator,
     fit_kwargs: Optional[dict] = None,
@@ -1962,7 +1933,7 @@ def finalize_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def deploy_model(
     model,
     model_name: str,
@@ -2055,7 +2026,7 @@ def deploy_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def save_model(
     model, model_name: str, model_only: bool = False, verbose: bool = True, **kwargs
 ):
@@ -2108,7 +2079,7 @@ def save_model(
     )
 
 
-# not using check_if_global_is_not_none on purpose
+# not using check_if_current_experiment on purpose
 def load_model(
     model_name: str,
     platform: Optional[str] = None,
@@ -2157,7 +2128,7 @@ def load_model(
 
     experiment = _CURRENT_EXPERIMENT
     if experiment is None:
-        experiment = _EXPERIMENT_CLASS()
+        experiment = _get_experiment_class()()
 
     return experiment.load_model(
         model_name=model_name,
@@ -2167,7 +2138,7 @@ def load_model(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def automl(
     optimize: str = "R2",
     use_holdout: bool = False,
@@ -2230,7 +2201,7 @@ def automl(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def pull(pop: bool = False) -> pd.DataFrame:
     """
     Returns the latest displayed table.
@@ -2249,7 +2220,7 @@ def pull(pop: bool = False) -> pd.DataFrame:
     return _CURRENT_EXPERIMENT.pull(pop=pop)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def models(
     type: Optional[str] = None,
     internal: bool = False,
@@ -2292,7 +2263,7 @@ def models(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def get_metrics(
     reset: bool = False,
     include_custom: bool = True,
@@ -2337,7 +2308,7 @@ def get_metrics(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def add_metric(
     id: str,
     name: str,
@@ -2393,7 +2364,7 @@ def add_metric(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def remove_metric(name_or_id: str):
     """
     Removes a metric from experiment.
@@ -2420,7 +2391,7 @@ def remove_metric(name_or_id: str):
     return _CURRENT_EXPERIMENT.remove_metric(name_or_id=name_or_id)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def get_logs(experiment_name: Optional[str] = None, save: bool = False) -> pd.DataFrame:
     """
     Returns a table of experiment logs. Only works when ``log_experiment``
@@ -2453,7 +2424,7 @@ def get_logs(experiment_name: Optional[str] = None, save: bool = False) -> pd.Da
     return _CURRENT_EXPERIMENT.get_logs(experiment_name=experiment_name, save=save)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def get_config(variable: Optional[str] = None):
     """
     This function is used to access global environment variables.
@@ -2479,7 +2450,7 @@ def get_config(variable: Optional[str] = None):
     return _CURRENT_EXPERIMENT.get_config(variable=variable)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def set_config(variable: str, value):
     """
     This function is used to reset global environment variables.
@@ -2494,7 +2465,7 @@ def set_config(variable: str, value):
     return _CURRENT_EXPERIMENT.set_config(variable=variable, value=value)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def save_experiment(
     path_or_file: Union[str, os.PathLike, BinaryIO], **cloudpickle_kwargs
 ) -> None:
@@ -2584,7 +2555,7 @@ def load_experiment(
         loaded experiment
 
     """
-    exp = _EXPERIMENT_CLASS.load_experiment(
+    exp = _get_experiment_class().load_experiment(
         path_or_file=path_or_file,
         data=data,
         data_func=data_func,
@@ -2596,7 +2567,7 @@ def load_experiment(
     return exp
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def get_leaderboard(
     finalize_models: bool = False,
     model_only: bool = False,
@@ -2654,7 +2625,7 @@ def get_leaderboard(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def dashboard(
     estimator,
     display_format: str = "dash",
@@ -2713,7 +2684,7 @@ def dashboard(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def create_app(estimator, app_kwargs: Optional[dict] = None) -> None:
     """
     This function creates a basic gradio app for inference.
@@ -2745,7 +2716,7 @@ def create_app(estimator, app_kwargs: Optional[dict] = None) -> None:
     return _CURRENT_EXPERIMENT.create_app(estimator=estimator, app_kwargs=app_kwargs)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def convert_model(estimator, language: str = "python") -> str:
     """
     This function transpiles trained machine learning models into native
@@ -2797,7 +2768,7 @@ def convert_model(estimator, language: str = "python") -> str:
     return _CURRENT_EXPERIMENT.convert_model(estimator, language)
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def check_fairness(estimator, sensitive_features: list, plot_kwargs: dict = {}):
     """
     There are many approaches to conceptualizing fairness. This function follows
@@ -2841,7 +2812,7 @@ def check_fairness(estimator, sensitive_features: list, plot_kwargs: dict = {}):
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def create_api(
     estimator, api_name: str, host: str = "127.0.0.1", port: int = 8000
 ) -> None:
@@ -2887,7 +2858,7 @@ def create_api(
     )
 
 
-@check_if_global_is_not_none(globals(), _CURRENT_EXPERIMENT_DECORATOR_DICT)
+@check_if_current_experiment(_current_experiment, _CURRENT_EXPERIMENT_EXCEPTION)
 def create_docker(
     api_name: str, base_image: str = "python:3.8-slim", expose_port: int = 8000
 ) -> None:
@@ -2994,7 +2965,7 @@ def check_drift(
     """
     experiment = _CURRENT_EXPERIMENT
     if experiment is None:
-        experiment = _EXPERIMENT_CLASS()
+        experiment = _get_experiment_class()()
 
     return experiment.check_drift(
         reference_data=reference_data,
@@ -3019,7 +2990,7 @@ def set_current_experiment(experiment: RegressionExperiment):
     """
     global _CURRENT_EXPERIMENT
 
-    if not isinstance(experiment, RegressionExperiment):
+    if not isinstance(experiment, _get_experiment_class()):
         raise TypeError(
             f"experiment must be a PyCaret RegressionExperiment object, got {type(experiment)}."
         )
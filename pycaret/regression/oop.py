@@ -89,7 +89,7 @@ class RegressionExperiment(_NonTSSupervisedExperiment, Preprocessor):
         ignore_features: Optional[List[str]] = None,
         keep_features: Optional[List[str]] = None,
         preprocess: bool = True,
-        create_date_columns: List[str] = ["day", "month", "year"],
+        create_date_columns: Tuple[str, ...] = ("day", "month", "year"),
         imputation_type: Optional[str] = "simple",
         numeric_imputation: str = "mean",
         categorical_imputation: str = "mode",
@@ -256,7 +256,7 @@ class RegressionExperiment(_NonTSSupervisedExperiment, Preprocessor):
             when preprocess is set to False.
 
 
-        create_date_columns: list of str, default = ["day", "month", "year"]
+        create_date_columns: list or tuple of str, default = ("day", "month", "year")
             Columns to create from the date features. Note that created features
             with zero variance (e.g. the feature hour in a column that only contains
             dates) are ignored. Allowed values are datetime attributes from
@@ -635,6 +635,8 @@ class RegressionExperiment(_NonTSSupervisedExperiment, Preprocessor):
                 If False: No caching is performed.
                 If True: A default temp directory is used.
                 If str: Path to the caching directory.
+                If "auto": Like True, but only the expensive steps (iterative
+                imputation, text embedding, outlier removal, PCA, ...) are cached.
 
         profile: bool, default = False
             When set to True, an interactive EDA report is displayed.
@@ -750,6 +752,7 @@ class RegressionExperiment(_NonTSSupervisedExperiment, Preprocessor):
         self.pipeline = InternalPipeline(
             steps=[("placeholder", None)],
             memory=self.memory,
+            memoize_steps=self.memoize_steps,
         )
 
         if preprocess:
@@ -864,8 +867,12 @@ class RegressionExperiment(_NonTSSupervisedExperiment, Preprocessor):
         container.append(["Target type", "Regression"])
         container.append(["Original data shape", self.data.shape])
         container.append(["Transformed data shape", self.dataset_transformed.shape])
-        container.append(["Transformed train set shape", self.train_transformed.shape])
-        container.append(["Transformed test set shape", self.test_transformed.shape])
+        container.append(
+            ["Transformed train set shape", self._transform_split("train").shape]
+        )
+        container.append(
+            ["Transformed test set shape", self._transform_split("test").shape]
+        )
         for fx, cols in self._fxs.items():
             if len(cols) > 0:
                 container.append([f"{fx} features", len(cols)])
@@ -1095,6 +1102,8 @@ class RegressionExperiment(_NonTSSupervisedExperiment, Preprocessor):
             you can use ``FugueBackend(session)`` to make this function running using
             Spark. For more details, see
             :class:`~pycaret.parallel.fugue_backend.FugueBackend`
+            To use all local cores, pass ``JoblibBackend()`` from
+            :mod:`pycaret.internal.parallel`.
 
 
         Returns:
@@ -69,7 +69,8 @@ def to_df(data, index=None, columns=None, dtypes=None):
     ----------
     data: list, tuple, dict, np.array, sp.matrix, pd.DataFrame or None
         Dataset to convert to a dataframe.  If None or already a
-        dataframe, return unchanged.
+        dataframe, return unchanged. Objects exposing ``to_pandas``
+        (e.g. pyarrow tables or polars dataframes) are converted with it.
 
     index: sequence or pd.Index
         Values for the dataframe's index.
@@ -91,6 +92,10 @@ def to_df(data, index=None, columns=None, dtypes=None):
     n_cols = lambda data: data.shape[1] if hasattr(data, "shape") else len(data[0])
 
     if data is not None:
+        # Columnar containers convert themselves without boxing every value
+        if not isinstance(data, pd.DataFrame) and hasattr(data, "to_pandas"):
+            data = data.to_pandas()
+
         if not isinstance(data, pd.DataFrame):
             # Assign default column names (dict already has column names)
             if not isinstance(data, dict) and columns is None:
@@ -105,8 +110,14 @@ def to_df(data, index=None, columns=None, dtypes=None):
             if dtypes is not None:
                 data = data.astype(dtypes)
 
-        # Convert all column names to str
-        data = data.rename(columns=lambda col: str(col))
+        # Convert all column names to str (rename copies the whole frame). When
+        # they already are, still return a new frame so that steps which edit
+        # their input don't write to the caller's object (e.g. pass-through
+        # wrappers handing it further down the pipeline)
+        if not all(isinstance(col, str) for col in data.columns):
+            data = data.rename(columns=lambda col: str(col))
+        else:
+            data = data.copy(deep=False)
 
     return data
 
@@ -160,12 +171,10 @@ def check_features_exist(features: List[str], X: pd.DataFrame):
     ValueError
         If any feature is not present in the feature dataframe
     """
-    missing_features = []
-    for fx in features:
-        if fx not in X.columns:
-            missing_features.append(fx)
+    columns = set(X.columns)
+    missing_features = [fx for fx in features if fx not in columns]
 
-    if len(missing_features) != 0:
+    if missing_features:
         raise ValueError(
             f"\n\nColumn(s): {missing_features} not found in the feature dataset!"
             "\nThey are either missing from the features or you have specified "
@@ -968,11 +977,31 @@ def check_if_global_is_not_none(globals_d: dict, global_names: dict):
     return decorator
 
 
+def check_if_current_experiment(get_experiment: Callable[[], Any], message: str):
+    """Raise ``ValueError(message)`` if ``get_experiment()`` returns None.
+
+    Unlike ``check_if_global_is_not_none``, the experiment is read through
+    the given getter instead of a lookup in the module's globals dict.
+
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if get_experiment() is None:
+                raise ValueError(message)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 def df_shrink_dtypes(df, skip=[], obj2cat=True, int2uint=False):
     """Shrink a dataframe.
 
     Return any possible smaller data types for DataFrame columns.
-    Allows `object`->`category`, `int`->`uint`, and exclusion.
+    Allows `object`/`string`->`category`, `int`->`uint`, and exclusion.
     From: https://github.com/fastai/fastai/blob/master/fastai/tabular/core.py
 
     """
@@ -998,9 +1027,9 @@ def df_shrink_dtypes(df, skip=[], obj2cat=True, int2uint=False):
 
     if obj2cat:
         # User wants to categorify dtype('Object'), which may not always save space
-        typemap["object"] = "category"
+        typemap["object"] = typemap["string"] = "category"
     else:
-        excl_types.add("object")
+        excl_types.update(("object", "string"))
 
     new_dtypes = {}
     exclude = lambda dt: dt[1].name not in excl_types and dt[0] not in skip
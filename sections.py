@@ -1,13 +1,26 @@
+import numpy as np
 import pandas as pd
 import streamlit as st
-from sklearn.preprocessing import LabelEncoder, OneHotEncoder
 
 from constant import ML_MODELS
-from train_model import compare_and_create_models, main as display_results
-from utils import load_data, display_data, display_description, padding, plot_graph
+from utils import (
+    describe_data,
+    load_data,
+    load_image,
+    display_data,
+    display_description,
+    hash_dataframe,
+    padding,
+    pipeline_memory,
+    plot_graph,
+)
 
-from pycaret.regression import setup as reg_setup
-from pycaret.classification import setup as clf_setup
+
+def display_results(created_models):
+    # train_model pulls in pycaret, only import it once there are results
+    from train_model import main
+
+    main(created_models)
 
 
 def data_ingestion():
@@ -18,27 +31,29 @@ def data_ingestion():
     if uploaded_file is not None:
         st.session_state["uploaded_file"] = uploaded_file
         data = load_data(uploaded_file)
+        description = describe_data(uploaded_file)
         display_data(data)
-        display_description(data, uploaded_file)
+        display_description(description)
         st.session_state["dataset"] = data
-
-        st.session_state["dataset_description"] = {
-            "rows": data.shape[0],
-            "columns": data.shape[1],
-            "missing_values": bool(data.isnull().sum().sum()),
-            "memory_size": data.memory_usage(deep=True).sum(),
-            "file_format": uploaded_file.name.split(".")[-1],
-        }
+        st.session_state["dataset_len"] = len(data)
+        st.session_state["dataset_description"] = description
     else:
         st.caption("Please upload a dataset to proceed.")
         padding()
         with st.columns([1, 1, 6.8])[-1]:
-            st.image("static/images/1.png")
+            st.image(load_image("static/images/1.png"))
 
 
-def data_transformation():
-    global new_data
+def _is_valid_reg_target(series):
+    return (
+        pd.api.types.is_numeric_dtype(series)
+        and series.notna().all()
+        and series.nunique() > 1
+    )
 
+
+@st.fragment
+def data_transformation():
     new_data = st.session_state["dataset"]
     st.session_state["extra_columns"] = st.multiselect(
         label="Select Columns to Drop",
@@ -46,23 +61,16 @@ def data_transformation():
         placeholder="Select extra columns to drop",
     )
     if st.session_state["extra_columns"] is not None:
-        st.session_state["new_data"] = new_data.drop(
-            st.session_state["extra_columns"], axis=1
-        )
+        st.session_state["new_data"] = new_data.loc[
+            :, ~new_data.columns.isin(st.session_state["extra_columns"])
+        ]
         # new_data = data.drop(st.session_state["extra_columns"], axis=1)
         # st.session_state["new_data"] = new_data
 
     with st.expander("Encode Columns", expanded=False, icon=":material/pin:"):
         st.session_state["encode_columns"] = st.selectbox(
             label="Select Columns to Encode",
-            options=[
-                "None",
-                *[
-                    i
-                    for i in new_data.columns
-                    if i not in st.session_state["extra_columns"]
-                ],
-            ],
+            options=["None", *st.session_state["new_data"].columns],
             placeholder="Select column to encode",
         )
         st.session_state["encoding_type"] = st.radio(
@@ -77,19 +85,14 @@ def data_transformation():
         ):
             encode_column = st.session_state["encode_columns"]
             if st.session_state["encoding_type"] == "Label Encoding":
-                encoder = LabelEncoder()
-                new_data[encode_column] = encoder.fit_transform(new_data[encode_column])
+                # sorted categories, same codes as LabelEncoder in the narrowest int
+                new_data[encode_column] = (
+                    new_data[encode_column].astype("category").cat.codes
+                )
             else:
-                encoder = OneHotEncoder(sparse_output=False)
-                encoded_data = encoder.fit_transform(new_data[[encode_column]])
-                encoded_df = pd.DataFrame(
-                    encoded_data,
-                    columns=[
-                        f"{encode_column}_{cat}" for cat in encoder.categories_[0]
-                    ],
+                new_data = pd.get_dummies(
+                    new_data, columns=[encode_column], dtype=np.uint8
                 )
-                new_data = new_data.drop(encode_column, axis=1)
-                new_data = pd.concat([new_data, encoded_df], axis=1)
                 st.session_state["new_data"] = new_data
 
     with st.expander(
@@ -129,43 +132,71 @@ def data_transformation():
     if (
         transform_data_button and st.session_state["dataset"] is not None
     ) or st.session_state["updated_data"]:
-        st.session_state["new_data"] = new_data.drop(
-            st.session_state["extra_columns"], axis=1
-        )
+        # drop the extra columns and the duplicate rows in a single selection
+        keep_columns = ~new_data.columns.isin(st.session_state["extra_columns"])
         if st.session_state["handle_duplicate_values"]:
-            st.session_state["new_data"] = new_data.drop_duplicates()
-        new_data = st.session_state["new_data"]
+            keep_rows = ~new_data.duplicated(subset=new_data.columns[keep_columns])
+            new_data = new_data.loc[keep_rows, keep_columns]
+        else:
+            new_data = new_data.loc[:, keep_columns]
+        st.session_state["new_data"] = new_data
 
         print("New data before transformation:")
         print(new_data.head())
 
-        for i in range(len(new_data.columns)):
-            try:
-                new_data = new_data.drop(st.session_state["extra_columns"], axis=1)
-                _, new_data = reg_setup(
+        # one setup() on the chosen target instead of retrying every column
+        target_column = st.session_state.get("target_column")
+        if target_column not in new_data.columns:
+            # no usable pick yet: last column that passes the cheap checks
+            target_column = next(
+                (
+                    column
+                    for column in reversed(new_data.columns)
+                    if _is_valid_reg_target(new_data[column])
+                ),
+                new_data.columns[-1],
+            )
+            print(f"No target column selected, using {target_column}")
+
+        from pycaret.regression import setup as reg_setup
+
+        # updated_data keeps this branch running on every fragment rerun, only
+        # redo setup() when the data or the options changed
+        setup_key = (
+            hash_dataframe(new_data),
+            target_column,
+            st.session_state["normalize_data"],
+            st.session_state["remove_outliers"],
+            st.session_state["numeric_imputation"],
+            st.session_state["categorical_imputation"],
+        )
+        try:
+            if st.session_state.get("transformation_setup_key") != setup_key:
+                reg_setup(
                     data=new_data,
-                    target=new_data.iloc[:, i],
+                    target=target_column,
                     normalize=st.session_state["normalize_data"],  # bool
                     remove_outliers=st.session_state["remove_outliers"],  # bool
                     numeric_imputation=st.session_state["numeric_imputation"],  # string
                     categorical_imputation=st.session_state[
                         "categorical_imputation"
                     ],  # string
+                    memory=pipeline_memory(),
                 )
-                print("New data afte    r transformation:")
-                print(new_data.head())
-
-                st.session_state["updated_data"] = True
-                if st.session_state["new_data"] is not None:
-                    st.caption("Updated Data Description:")
-                    display_data(new_data.head(10), height=100)
-                break
-            except Exception as e:
-                print(f"Exception occurred: {e}")
-                continue
+                st.session_state["transformation_setup_key"] = setup_key
+            print("New data afte    r transformation:")
+            print(new_data.head())
+
+            st.session_state["updated_data"] = True
+            if st.session_state["new_data"] is not None:
+                st.caption("Updated Data Description:")
+                display_data(new_data.head(10), height=100)
+        except Exception as e:
+            print(f"Exception occurred: {e}")
     elif not transform_data_button and not st.session_state["updated_data"]:
         st.caption("No transformations applied.")
-        display_data(st.session_state["dataset"], height=100)
+        # the preview only shows a few rows, keep the rest out of the Arrow payload
+        display_data(st.session_state["dataset"].head(100), height=100)
 
 
 def train_model_section():
@@ -174,12 +205,11 @@ def train_model_section():
         ["Regression", "Classification"],
         horizontal=True,
     )
+    extra_columns = set(st.session_state["extra_columns"])
     st.session_state["target_column"] = st.selectbox(
         label="Select Target Column",
         options=[
-            i
-            for i in st.session_state["new_data"].columns
-            if i not in st.session_state["extra_columns"]
+            i for i in st.session_state["new_data"].columns if i not in extra_columns
         ],
         placeholder="Select target column",
     )
@@ -189,7 +219,7 @@ def train_model_section():
     st.session_state["train_split_perc"] = st.slider("Train Split", 0.0, 1.0, 0.7)
     # with _2:
     #     chart = plot_graph(train_split_perc)
-    #     st.plotly_chart(chart, use_container_width=True)
+    #     st.markdown(chart, unsafe_allow_html=True)
     # test_split_perc = st.slider(
     #     "Test Split", 0.0, 1.0, abs(1.0 - train_split_perc), disabled=True
     # )
@@ -197,6 +227,15 @@ def train_model_section():
     if st.session_state["train_split_perc"] < 0.5:
         st.toast("Train Split should be greater than Test Split")
 
+    st.session_state["tune_threshold"] = st.slider(
+        "Tune Models Within",
+        0.0,
+        1.0,
+        0.05,
+        help="Only models scoring within this fraction of the best one are tuned.",
+        disabled=st.session_state["lightning_mode"],
+    )
+
     # st.write("Models to be trained")
     left, right = st.columns(2)
 
@@ -252,6 +291,8 @@ def train_model_section():
             st.write("Error fetching the dataset.")
 
         else:
+            from train_model import compare_and_create_models
+
             try:
                 created_models = compare_and_create_models(
                     st.session_state["new_data"],
@@ -260,8 +301,6 @@ def train_model_section():
                     st.session_state["models_to_train"],
                 )
 
-                st.session_state["created_models"] = created_models
-
                 # st.write(created_models)
                 return created_models
             except ValueError:
@@ -1,96 +1,163 @@
+import hashlib
+import importlib
 import pickle
+from functools import lru_cache
+from importlib.util import find_spec
+from pathlib import Path
+
+import joblib
 import pandas as pd
 import streamlit as st
-from pycaret.regression import (
-    setup as reg_setup,
-    pull as reg_pull,
-    compare_models as reg_compare_models,
-    create_model as reg_create_model,
-    tune_model as reg_tune_model,
-    predict_model as reg_predict_model,
-)
-from pycaret.classification import (
-    setup as clf_setup,
-    pull as clf_pull,
-    compare_models as clf_compare_models,
-    create_model as clf_create_model,
-    tune_model as clf_tune_model,
-    predict_model as clf_predict_model,
-)
+from constant import MODEL_HTML
+from utils import downcast_dtypes, hash_dataframe, pipeline_memory, read_csv
+
+MODELS_CACHE_DIR = Path(".cache")
+# lz4 barely costs anything to (de)compress, zlib is the fallback joblib always has
+MODELS_CACHE_COMPRESS = ("lz4", 3) if find_spec("lz4") else 3
+# part of the cache key, bump it whenever _train_models' output changes shape so
+# dumps in the old format are left behind instead of being served
+MODELS_CACHE_VERSION = 2
+
+
+@lru_cache(maxsize=2)
+def _pycaret(task_type):
+    # each pycaret module pulls in the whole modelling stack, so only the one
+    # for the chosen task is imported, on first use
+    return importlib.import_module(
+        "pycaret.regression" if task_type == "Regression" else "pycaret.classification"
+    )
 
 
 def tune_model_wrapper(model, task_type):
     try:
-        if task_type == "Regression":
-            #     _ = reg_setup(dataset, target=target_column)
-            # model = reg_create_model(model, verbose=True)
-            _ = reg_tune_model(model, verbose=True)
-        else:
-            # _ = clf_setup(dataset, target=target_column)
-            # model = clf_create_model(model, verbose=True)
-            _ = clf_tune_model(model, verbose=True)
-        return model
+        return _pycaret(task_type).tune_model(model, verbose=True)
     except Exception as e:
         st.error(f"Error tuning model {model}: {e}")
+        # the untuned model, callers check for it by identity
+        return model
     # else:
     # global data_editor_container
     # st.data_editor(model.get_params())
 
 
-def create_model_wrapper(model, task_type):
-    try:
-        if task_type == "Regression":
-            created_model = reg_create_model(model, verbose=True)
-        else:
-            created_model = clf_create_model(model, verbose=True)
-        return created_model
+def compare_and_create_models(dataset, task_type, target_column, models_to_train):
+    params = (
+        task_type,
+        target_column,
+        tuple(models_to_train),
+        st.session_state["lightning_mode"],
+        st.session_state.get("tune_threshold", 0.05),
+    )
+    models_key = hashlib.sha1(
+        repr((MODELS_CACHE_VERSION, hash_dataframe(dataset), *params)).encode()
+    ).hexdigest()
+    created_models = _fit_all(models_key, dataset, *params)
+    # main() keys the display payload on it, it is set together with the
+    # models it belongs to
+    st.session_state["created_models_key"] = models_key
+    return created_models
 
-    except Exception as e:
-        st.error(f"Error creating {model}: {e}")
 
+@st.cache_resource(show_spinner=False)
+def _fit_all(
+    models_key,
+    _dataset,
+    task_type,
+    target_column,
+    models_to_train,
+    lightning_mode,
+    tune_threshold,
+):
+    # fitted models are kept in memory for this process and dumped to disk so a
+    # restarted app can load them instead of refitting
+    path = MODELS_CACHE_DIR / f"{models_key}.joblib"
+    if path.exists():
+        return joblib.load(path)
+
+    created_models = _train_models(
+        _dataset,
+        task_type,
+        target_column,
+        list(models_to_train),
+        lightning_mode,
+        tune_threshold,
+    )
 
-def compare_and_create_models(dataset, task_type, target_column, models_to_train):
+    MODELS_CACHE_DIR.mkdir(exist_ok=True)
+    joblib.dump(created_models, path, compress=MODELS_CACHE_COMPRESS)
+    return created_models
+
+
+def _train_models(
+    dataset, task_type, target_column, models_to_train, lightning_mode, tune_threshold
+):
+    pc = _pycaret(task_type)
     with st.spinner("Creating models, please wait..."):
-        if task_type == "Regression":
-            _ = reg_setup(dataset, target=target_column)
-            compared_models = reg_compare_models(
-                include=models_to_train,
-                sort="RMSE",
-                budget_time=2.0 if st.session_state["lightning_mode"] else None,
-                n_select=9,
-            )
-        else:
-            _ = clf_setup(dataset, target=target_column)
-            compared_models = clf_compare_models(
-                include=models_to_train,
-                sort="Accuracy",
-                budget_time=2.0 if st.session_state["lightning_mode"] else None,
-                n_select=9,
-            )
-
-    if st.session_state["lightning_mode"]:
-        created_models = [
-            (
-                create_model_wrapper(model, task_type),
-                prediction_wrapper(model, task_type),
-            )
-            for model in compared_models
-        ]
+        _ = pc.setup(dataset, target=target_column, memory=pipeline_memory())
+        compared_models = pc.compare_models(
+            include=models_to_train,
+            sort="RMSE" if task_type == "Regression" else "Accuracy",
+            budget_time=2.0 if lightning_mode else None,
+            n_select=9,
+        )
+        scores = pc.pull()
+
+    # a single selected model comes back bare rather than in a list
+    if not isinstance(compared_models, list):
+        compared_models = [compared_models]
+
+    # compare_models returns the models fitted, only tuning is left. Models
+    # that failed to fit are dropped from the returned list but not always
+    # from the grid, so each model is paired with its row by name
+    get_model_name = pc.get_current_experiment()._get_model_name
+    created_models = [
+        (model, scores.loc[scores["Model"] == get_model_name(model)].head(1))
+        for model in compared_models
+    ]
+    if not lightning_mode:
+        # a grid search per model costs far more than the comparison, so only
+        # the models close enough to the best score are worth tuning
+        to_tune = _close_to_best(created_models, task_type, tune_threshold)
+        # one at a time: tune_model reads the experiment's shared display
+        # container, patches sklearn globals and redirects stdout, and every
+        # search already runs its folds on all cores
+        for i in to_tune:
+            created_models[i] = _tune_if_better(pc, *created_models[i], task_type)
+
+    return [(model, _model_scores(metrics)) for model, metrics in created_models]
+
+
+def _tune_if_better(pc, model, metrics, task_type):
+    # keep the tuned model only if its cross-validated mean beats the compared
+    # one, and show the scores of whichever model is kept
+    tuned_model = tune_model_wrapper(model, task_type)
+    if tuned_model is model:
+        return model, metrics
+
+    tuned_metrics = pc.pull().loc[["Mean"]]
+    if task_type == "Regression":
+        better = tuned_metrics["RMSE"].iat[0] < metrics["RMSE"].iat[0]
     else:
-        created_models = [
-            (
-                tune_model_wrapper(create_model_wrapper(model, task_type), task_type),
-                prediction_wrapper(model, task_type),
-            )
-            for model in compared_models
-        ]
-    # for model in compared_models:
-    #     try:
-    #         created_models.append((tune_model_wrapper(create_model_wrapper(model, task_type), task_type), prediction_wrapper(model, task_type)))
-    #     except Exception as e:
-    #         st.error(f"Error creating model {model}: {e}")
-
-    return created_models
+        better = tuned_metrics["Accuracy"].iat[0] > metrics["Accuracy"].iat[0]
+    return (tuned_model, tuned_metrics) if better else (model, metrics)
+
+
+def _close_to_best(created_models, task_type, tune_threshold):
+    # positions of the models whose own grid row scores within tune_threshold
+    # of the best of them, models without a row are left untuned
+    metric = "RMSE" if task_type == "Regression" else "Accuracy"
+    scored = {
+        i: metrics[metric].iat[0]
+        for i, (_, metrics) in enumerate(created_models)
+        if not metrics.empty
+    }
+    if not scored:
+        return []
+    if task_type == "Regression":
+        cutoff = min(scored.values()) * (1 + tune_threshold)
+        return [i for i, rmse in scored.items() if rmse <= cutoff]
+    cutoff = max(scored.values()) * (1 - tune_threshold)
+    return [i for i, accuracy in scored.items() if accuracy >= cutoff]
 
 
 def grrrrr():
@@ -107,19 +174,19 @@ def reset_model_state(model, data_editor_container):
     )
 
 
-def prediction_wrapper(model, task_type):
-    try:
-        if task_type == "Regression":
-            reg_predict_model(model, verbose=True)
-            output = reg_pull()
-        else:
-            clf_predict_model(model, verbose=True)
-            output = clf_pull()
+def _model_scores(output):
+    # the scoring grid is kept in session state, store only the displayed
+    # columns, in narrow dtypes
+    output = output.drop(columns=["TT (Sec)", "RMSLE", "Model"], errors="ignore")
+    return output.astype(
+        {c: "float32" for c in output.select_dtypes("float64").columns}
+    )
 
-        return output
 
-    except Exception as e:
-        st.error(f"Error training model {model}: {e}")
+@st.cache_resource(show_spinner=False)
+def _make_estimator(estimator_class, params):
+    # unfitted template shared across reruns, create_model clones it before fitting
+    return estimator_class(**dict(params))
 
 
 # Function to train a custom model
@@ -130,17 +197,15 @@ def train_custom_model(model, task_type, hyperparams):
         st.write(hyperparams)
         st.write(hyperparams.dtypes)
 
-        model.set_params(**hyperparams.to_dict("records")[0])
+        params = {**model.get_params(deep=False), **hyperparams.to_dict("records")[0]}
+        model = _make_estimator(type(model), tuple(sorted(params.items())))
 
-        if task_type == "Regression":
-            _ = reg_setup(model, verbose=True)
-            model = reg_create_model(model, verbose=True)
-        else:
-            _ = clf_setup(model, verbose=True)
-            model = clf_create_model(model, verbose=True)
+        pc = _pycaret(task_type)
+        _ = pc.setup(model, verbose=True)
+        model = pc.create_model(model, verbose=True)
 
         st.session_state[f"current_hyperparams_{model}"] = model.get_params()
-        st.success(f"Model retrained: {model}")
+        st.success(f"Model retrained: {type(model).__name__}")
 
         return model
 
@@ -148,49 +213,110 @@ def train_custom_model(model, task_type, hyperparams):
         st.error(f"Error training custom model {model}: {e}")
 
 
+def _serialize_model(model):
+    # skops writes a smaller, safer-to-load archive than pickle when it's there
+    if find_spec("skops"):
+        import skops.io as sio
+
+        return sio.dumps(model), "skops"
+    return pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL), "pkl"
+
+
+def _export_onnx(model):
+    # optional second download, not every estimator has an onnx converter
+    if not find_spec("skl2onnx"):
+        return None
+    try:
+        from skl2onnx import convert_sklearn
+        from skl2onnx.common.data_types import FloatTensorType
+
+        initial_types = [("input", FloatTensorType([None, model.n_features_in_]))]
+        return convert_sklearn(model, initial_types=initial_types).SerializeToString()
+    except Exception:
+        return None
+
+
+@st.cache_data(show_spinner=False)
+def _compute_display_payload(models_key, _created_models):
+    # keyed on the _fit_all key of the models, the models themselves are not
+    # hashed (leading underscore)
+    payload = []
+    for model, metrics in _created_models:
+        payload.append(
+            {
+                "model_name": type(model).__name__,
+                # str() of an estimator formats every hyperparameter, do it once
+                "state_key": str(model),
+                "hyperparams": pd.DataFrame(model.get_params(), index=["Values"]),
+                # download payloads, serialized once rather than on every rerun
+                "serialized": _serialize_model(model),
+                "onnx": _export_onnx(model),
+                "metrics": metrics,
+            }
+        )
+    return payload
+
+
 def main(created_models):
+    # the widgets have to be redrawn on every rerun, but when the models are the
+    # same as last time the payload is reused without a cache lookup
+    models_key = st.session_state["created_models_key"]
+    last_payload = st.session_state.get("display_payload")
+    if last_payload is not None and last_payload[0] == models_key:
+        payload = last_payload[1]
+    else:
+        payload = _compute_display_payload(models_key, created_models)
+        st.session_state["display_payload"] = (models_key, payload)
+
     with st.spinner("Creating models, please wait..."):
-        for model, metrics in created_models:
-            model_name = str(model).split("(")[0]
+        for (model, _), entry in zip(created_models, payload):
+            model_name = entry["model_name"]
+            state_key = entry["state_key"]
 
-            if f"initial_hyperparams_{model}" not in st.session_state:
-                st.session_state[f"initial_hyperparams_{model}"] = pd.DataFrame(
-                    model.get_params(), index=["Values"]
-                )
-            if f"button_state_{model}" not in st.session_state:
-                st.session_state[f"button_state_{model}"] = True
+            if f"initial_hyperparams_{state_key}" not in st.session_state:
+                st.session_state[f"initial_hyperparams_{state_key}"] = entry[
+                    "hyperparams"
+                ].copy()
+            if f"button_state_{state_key}" not in st.session_state:
+                st.session_state[f"button_state_{state_key}"] = True
 
             with st.container(border=True):
                 left, right = st.columns([3, 1])
                 with left:
                     st.write(f"#### {model_name}")
+                    if model_name in MODEL_HTML:
+                        st.write(MODEL_HTML[model_name], unsafe_allow_html=True)
                     st.caption("Hyperparameters")
-                    hyperparams = pd.DataFrame(model.get_params(), index=["Values"])
+                    hyperparams = entry["hyperparams"]
                     data_editor_container = st.empty()
-                    st.session_state[f"current_hyperparams_{model}"] = (
+                    st.session_state[f"current_hyperparams_{state_key}"] = (
                         data_editor_container.data_editor(hyperparams)
                     )
 
-                    # st.session_state[f"current_hyperparams_{model}"] = hyperparams.copy()
-                    dataframes_equal = st.session_state[
-                        f"current_hyperparams_{model}"
-                    ].equals(
-                        # hyperparams
-                        st.session_state[f"initial_hyperparams_{model}"]
-                    )
-                    st.session_state[f"button_state_{model}"] = dataframes_equal
+                    # the edited/initial hyperparameter comparison that drives
+                    # button_state is skipped while the custom-model buttons
+                    # are hard-disabled, nothing reads it
 
                     _1, _2, _3, _4 = st.columns(4)
                     temp_container = st.empty()
 
                     with _1:
+                        serialized, extension = entry["serialized"]
                         download_simple = st.download_button(
                             f"Download Tuned Model",
-                            pickle.dumps(model),
-                            file_name=f"{model_name}_model.pkl",
-                            key=f"{model}_download_simple_download_button",
+                            serialized,
+                            file_name=f"{model_name}_model.{extension}",
+                            key=f"{state_key}_download_simple_download_button",
                             use_container_width=True,
                         )
+                        if entry["onnx"] is not None:
+                            st.download_button(
+                                "Download ONNX Model",
+                                entry["onnx"],
+                                file_name=f"{model_name}_model.onnx",
+                                key=f"{state_key}_download_onnx_download_button",
+                                use_container_width=True,
+                            )
                     # with _2:
                     # tune_button = st.button(
                     #     "Tune Model",
@@ -204,7 +330,7 @@ def main(created_models):
                             use_container_width=True,
                             # disabled=not st.session_state[f"button_state_{model}"],
                             # on_click=lambda: train_custom_model(model, task_type),
-                            key=f"{model}_train",
+                            key=f"{state_key}_train",
                             disabled=True,
                         )
 
@@ -219,7 +345,7 @@ def main(created_models):
                             use_container_width=True,
                             # disabled=st.session_state[f"button_state_{model}"],
                             # on_click=grrrrr,
-                            key=f"{model}_download_custom",
+                            key=f"{state_key}_download_custom",
                             disabled=True,
                         )
 
@@ -227,7 +353,7 @@ def main(created_models):
                         reset_button = st.button(
                             "Reset Hyperparameters",
                             use_container_width=True,
-                            key=f"{model}_reset_button",
+                            key=f"{state_key}_reset_button",
                             disabled=True,
                         )
                         if reset_button:
@@ -254,13 +380,7 @@ def main(created_models):
                         st.write("#### Metrics")
                         st.caption(f"Performance metrics for {model_name}")
                         st.dataframe(
-                            metrics[
-                                [
-                                    i
-                                    for i in metrics.columns
-                                    if i not in ["RMSLE", "Model"]
-                                ]
-                            ],
+                            entry["metrics"],
                             hide_index=True,
                             use_container_width=True,
                         )
@@ -274,7 +394,10 @@ if __name__ == "__main__":
     target_column = "Age (Years)"
     models_to_train = ["svm", "dt", "ada", "gbr"]
     task_type = "Regression"
-    dataset = pd.read_csv("static/data/cats_dataset.csv")
+    # same narrowing uploads get in utils._read_data
+    dataset = downcast_dtypes(
+        read_csv(Path("static/data/cats_dataset.csv").read_bytes())
+    )
 
     if "created_models" not in st.session_state:
         st.session_state.created_models = compare_and_create_models(
@@ -1,7 +1,7 @@
 # import yaml
 import streamlit as st
 import streamlit_authenticator as stauth
-from s3funcs import create_user_folder, load_yaml_from_s3, save_yaml_to_s3
+from s3funcs import load_yaml_from_s3, save_yaml_to_s3
 from botocore.exceptions import ClientError
 from maxmailer import send_welcome
 
@@ -88,8 +88,8 @@ with placeholder.container():
                 name_of_registered_user,
             ) = authenticator.register_user(pre_authorization=False)
             if email_of_registered_user:
-                # Create a folder in S3 for the new user
-                create_user_folder(username_of_registered_user)
+                # S3 has no real folders, the user's prefix appears with their
+                # first upload
                 # send_welcome(email_of_registered_user, name_of_registered_user)
                 # Save the updated configuration back to S3
                 save_yaml_to_s3(config)
@@ -1,5 +1,7 @@
 import os
 import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
@@ -9,6 +11,46 @@ username = os.environ.get("GMAIL_USERNAME")
 password = os.environ.get("GMAIL_PASSWORD")
 
 
+# each mailer thread keeps one authenticated session open, so bursts of
+# signups don't pay the TCP + TLS + AUTH handshake for every email
+_local = threading.local()
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="maxmailer")
+
+
+def _connect():
+    server = smtplib.SMTP(smtp_server, smtp_port)
+    server.starttls()  # Upgrade the connection to a secure encrypted SSL/TLS connection
+    server.login(username, password)
+    return server
+
+
+def _get_server():
+    server = getattr(_local, "server", None)
+    if server is not None:
+        try:
+            server.noop()
+            return server
+        except (smtplib.SMTPException, OSError):
+            server.close()
+    _local.server = _connect()
+    return _local.server
+
+
+def _send(email, msg):
+    try:
+        try:
+            _get_server().sendmail(username, email, msg)
+        except smtplib.SMTPServerDisconnected:
+            # the server dropped the idle session between noop and send
+            _local.server = _connect()
+            _local.server.sendmail(username, email, msg)
+
+        print("Email sent successfully!")
+
+    except Exception as e:
+        print(f"Failed to send email: {e}")
+
+
 def send_welcome(email, name):
     if username is None or password is None:
         print("Error: SMTP credentials are not set.")
@@ -22,22 +64,5 @@ def send_welcome(email, name):
     body = f"Dear {name},\n\nWelcome to our platform! We are excited to have you on board.\n\nPlease let us know if you have any questions or need assistance.\n\nBest regards,\nThe Platform Team"
     msg.attach(MIMEText(body, "plain"))
 
-    server = None
-    try:
-        server = smtplib.SMTP(smtp_server, smtp_port)
-        server.starttls()  # Upgrade the connection to a secure encrypted SSL/TLS connection
-
-        # Login to the SMTP server
-        # server.login(username, password)
-        server.login(username, password)
-
-        server.sendmail(username, email, msg.as_string())
-
-        print("Email sent successfully!")
-
-    except Exception as e:
-        print(f"Failed to send email: {e}")
-
-    finally:
-        if server is not None:
-            server.quit()
+    # sent in the background so the signup page doesn't wait on Gmail
+    return _executor.submit(_send, email, msg.as_string())
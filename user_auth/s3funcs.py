@@ -1,57 +1,66 @@
 import os  # type:ignore
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import boto3  # type:ignore
+import streamlit as st
 import yaml  # type:ignore
+from botocore.config import Config  # type:ignore
 from botocore.exceptions import ClientError  # type:ignore
 
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
 AWS_DEFAULT_REGION = os.environ.get("AWS_DEFAULT_REGION")
 AWS_ACCESS_KEY_ID = os.environ.get("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = os.environ.get("AWS_SECRET_ACCESS_KEY")
 S3_BUCKET_NAME = os.getenv("S3_BUCKET_NAME", "maximusml")
 
-s3_client = boto3.client(
-    "s3",
-    region_name=AWS_DEFAULT_REGION,
-    aws_access_key_id=AWS_ACCESS_KEY_ID,
-    aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-)
+# uploads run off the signup handler; a single worker keeps the saves in the
+# order they were made so an older config never lands on top of a newer one
+_upload_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="s3funcs")
+
 
-s3_resource = boto3.resource(
-    "s3",
-    region_name=AWS_DEFAULT_REGION,
-    aws_access_key_id=AWS_ACCESS_KEY_ID,
-    aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-)
+@lru_cache(maxsize=None)
+def s3_client():
+    # built on first use so importing this module stays cheap, and shared by
+    # every session so concurrent signups draw from one connection pool
+    return boto3.client(
+        "s3",
+        region_name=AWS_DEFAULT_REGION,
+        aws_access_key_id=AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+        config=Config(max_pool_connections=32, retries={"mode": "adaptive"}),
+    )
 
 
-def create_user_folder(username):
-    folder_name = f"{username}/"
+def _put_yaml(YAML_KEY, yaml_data):
     try:
-        s3_client.put_object(Bucket=S3_BUCKET_NAME, Key=folder_name)
-        print(
-            f"Folder '{folder_name}' created successfully in bucket '{S3_BUCKET_NAME}'"
-        )
+        s3_client().put_object(Bucket=S3_BUCKET_NAME, Key=YAML_KEY, Body=yaml_data)
+        load_yaml_from_s3.clear()
+        print(f"YAML file saved successfully to {S3_BUCKET_NAME}/{YAML_KEY}")
     except ClientError as e:
-        print(f"Error creating folder: {e}")
+        print(f"Error saving YAML to S3: {e}")
 
 
 def save_yaml_to_s3(config):
     YAML_KEY = "credentials.yaml"
-    yaml_data = yaml.dump(config, default_flow_style=False)
-
-    try:
-        s3_client.put_object(Bucket=S3_BUCKET_NAME, Key=YAML_KEY, Body=yaml_data)
-        print(f"YAML file saved successfully to {S3_BUCKET_NAME}/{YAML_KEY}")
-    except ClientError as e:
-        print(f"Error saving YAML to S3: {e}")
+    # dumped here, the caller may keep mutating config after this returns
+    yaml_data = yaml.dump(config, Dumper=SafeDumper, default_flow_style=False)
+    return _upload_executor.submit(_put_yaml, YAML_KEY, yaml_data)
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def load_yaml_from_s3():
     YAML_KEY = "credentials.yaml"
     try:
-        response = s3_client.get_object(Bucket=S3_BUCKET_NAME, Key=YAML_KEY)
-        yaml_data = response["Body"].read().decode("utf-8")
-        config = yaml.safe_load(yaml_data)
-        return config
+        response = s3_client().get_object(Bucket=S3_BUCKET_NAME, Key=YAML_KEY)
     except ClientError as e:
+        # re-raised rather than returning None, st.cache_data doesn't cache
+        # exceptions so one failed request isn't served to every session
         print(f"Error loading YAML from S3: {e}")
-        return None
+        raise
+    # the parser reads the streaming body itself, no bytes/str copies
+    return yaml.load(response["Body"], Loader=SafeLoader)
@@ -1,6 +1,12 @@
+import datetime
+import hashlib
+import io
+from importlib.util import find_spec
+
 import pandas as pd
 import streamlit as st
-import plotly.express as px
+from joblib import Memory, Parallel, delayed
+from PIL import Image
 
 
 def init_app():
@@ -30,10 +36,13 @@ def init_app():
             "missing_values": None,
             "memory_size": None,
             "file_format": None,
+            "has_duplicates": None,
         }
 
     if "dataset" not in st.session_state:
         st.session_state["dataset"] = pd.DataFrame()
+    if "dataset_len" not in st.session_state:
+        st.session_state["dataset_len"] = 0
     if "handle_null_values" not in st.session_state:
         st.session_state["handle_null_values"] = None
     if "normalize_data" not in st.session_state:
@@ -50,43 +59,151 @@ def init_app():
         st.session_state["final_dataset"] = None
     if "training_results" not in st.session_state:
         st.session_state["training_results"] = None
+    if "created_models" not in st.session_state:
+        st.session_state["created_models"] = None
+    if "created_models_key" not in st.session_state:
+        st.session_state["created_models_key"] = None
     if "ingest_data_button" not in st.session_state:
         st.session_state["ingest_data_button"] = False
     if "normalization_type" not in st.session_state:
         st.session_state["normalization_type"] = False
     if "lightning_mode" not in st.session_state:
         st.session_state["lightning_mode"] = False
+    if "tune_threshold" not in st.session_state:
+        st.session_state["tune_threshold"] = 0.05
     if "updated_data" not in st.session_state:
         st.session_state["updated_data"] = None
 
 
+@st.cache_resource(show_spinner=False)
+def load_image(path):
+    return Image.open(path).convert("RGBA")
+
+
+@st.cache_resource(show_spinner=False)
+def pipeline_memory():
+    # shared by every setup() call so unchanged preprocessing steps are reused
+    return Memory(".sklearn_cache", verbose=0)
+
+
+def hash_dataframe(data):
+    digest = hashlib.sha1(repr(tuple(data.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
 def load_data(uploaded_file):
-    if uploaded_file.name.endswith(".csv"):
-        data = pd.read_csv(uploaded_file)
-    elif uploaded_file.name.endswith(".xlsx") or uploaded_file.name.endswith(".xls"):
-        data = pd.read_excel(uploaded_file)
+    return _read_data(uploaded_file.name, uploaded_file.getvalue())
+
+
+def describe_data(uploaded_file):
+    return _describe_data(uploaded_file.name, uploaded_file.getvalue())
+
+
+@st.cache_data(show_spinner=False)
+def _describe_data(file_name, file_bytes):
+    # full-frame scans, run once per uploaded file instead of on every rerun
+    data = _read_data(file_name, file_bytes)
+    return {
+        "rows": data.shape[0],
+        "columns": data.shape[1],
+        "missing_values": bool(data.isna().any().any()),
+        "memory_size": _memory_size(data),
+        "file_format": file_name.split(".")[-1],
+        "has_duplicates": bool(data.duplicated().any()),
+    }
+
+
+@st.cache_data(show_spinner=False, persist="disk")
+def _read_data(file_name, file_bytes):
+    if file_name.endswith(".csv"):
+        data = read_csv(file_bytes)
+    elif file_name.endswith(".xlsx") or file_name.endswith(".xls"):
+        engine = "calamine" if find_spec("python_calamine") else None
+        data = pd.read_excel(io.BytesIO(file_bytes), engine=engine)
     else:
         data = pd.DataFrame()
 
-    data.to_csv("output/temp.csv")
+    return downcast_dtypes(data)
+
+
+def read_csv(file_bytes):
+    try:
+        # multithreaded Arrow parser, still producing numpy-backed columns
+        data = pd.read_csv(io.BytesIO(file_bytes), engine="pyarrow")
+    except ValueError:
+        # files Arrow rejects (ragged rows, odd quoting) go through the C parser
+        return pd.read_csv(io.BytesIO(file_bytes))
+    return _arrow_temporals_to_pandas(data)
+
+
+def _arrow_temporals_to_pandas(data):
+    # Arrow infers ISO dates and times, which pandas hands back as object
+    # columns of datetime.date / datetime.time; dates become datetime64 like
+    # timestamps already are, times go back to the strings the C parser gives
+    for column in data.select_dtypes("object"):
+        values = data[column].dropna()
+        if values.empty:
+            continue
+        first = values.iat[0]
+        if isinstance(first, datetime.date) and not isinstance(
+            first, datetime.datetime
+        ):
+            data[column] = pd.to_datetime(data[column])
+        elif isinstance(first, datetime.time):
+            data[column] = data[column].map(str, na_action="ignore")
     return data
 
 
+def downcast_dtypes(data):
+    # lossless: values come out the same, only in narrower dtypes. Columns are
+    # independent, scan them on threads: the numpy min/max and casts behind
+    # to_numeric release the GIL
+    if not len(data.columns):
+        return data
+    columns = Parallel(n_jobs=-1, prefer="threads")(
+        delayed(_downcast_column)(data[column]) for column in data.columns
+    )
+    return pd.concat(columns, axis=1)
+
+
+def _downcast_column(series):
+    # narrowest numeric dtype that holds the column, repeated strings as category
+    if series.dtype.kind in "iu":
+        return pd.to_numeric(series, downcast="integer")
+    if series.dtype.kind == "f":
+        # only when float32 holds every value exactly, a rounded 0.1 would
+        # change what gets hashed, previewed and trained on
+        narrowed = series.astype("float32")
+        if narrowed.astype(series.dtype).equals(series):
+            return narrowed
+        return series
+    if series.dtype == object and series.nunique() < len(series) / 2:
+        return series.astype("category")
+    return series
+
+
+def _memory_size(data):
+    # object columns can hold dates, times or bools as well as strings, let
+    # pandas measure whatever is there; this runs once per uploaded file
+    return int(data.memory_usage(deep=True).sum())
+
+
 def display_data(data, height=180):
     if not data.empty:
         st.dataframe(data, height=height)
 
 
-def display_description(data, uploaded_file):
+def display_description(description):
     with st.container(border=True):
         left, right = st.columns(2)
 
         with left:
             st.write(
                 f"""
-                :gray[Row:] {data.shape[0]} <br>
-                :gray[File Format:] {uploaded_file.name.split('.')[-1] if uploaded_file.name.split('.')[-1]!=None else "Unknown"} <br>
-                :gray[Has Duplicates:] {bool(data.duplicated().sum().sum())}
+                :gray[Row:] {description["rows"]} <br>
+                :gray[File Format:] {description["file_format"] or "Unknown"} <br>
+                :gray[Has Duplicates:] {description["has_duplicates"]}
             """,
                 unsafe_allow_html=True,
             )
@@ -94,9 +211,9 @@ def display_description(data, uploaded_file):
         with right:
             st.write(
                 f"""
-                :gray[Columns:] {data.shape[1]} <br>
-                :gray[Memory Size:] {data.memory_usage(deep=True).sum()} bytes <br>
-                :gray[Missing Values:] {bool(data.isnull().sum().sum())}
+                :gray[Columns:] {description["columns"]} <br>
+                :gray[Memory Size:] {description["memory_size"]} bytes <br>
+                :gray[Missing Values:] {description["missing_values"]}
             """,
                 unsafe_allow_html=True,
             )
@@ -107,25 +224,9 @@ def padding(n=1):
 
 
 def plot_graph(train_split):
-    data = {
-        "category": ["Test Split", "Train Split"],
-        "values": [train_split, 1 - train_split],
-    }
-
-    fig = px.pie(
-        data,
-        names="category",
-        values="values",
-        color_discrete_sequence=["#272727", "#6d6d6e"],
-    )
-    fig.update_layout(
-        height=60,
-        width=60,
-        margin=dict(t=10, b=0, l=0, r=70),
-        xaxis=dict(visible=False),
-        yaxis=dict(visible=False),
-        showlegend=False,
+    # a two-slice conic-gradient circle renders the split without pulling in
+    # plotly; display with st.markdown(..., unsafe_allow_html=True)
+    return (
+        f'<div style="background:conic-gradient(#272727 0 {train_split * 360}deg,'
+        '#6d6d6e 0);width:60px;height:60px;border-radius:50%"></div>'
     )
-    fig.update_traces(textinfo="none", hoverinfo="none")
-
-    return fig